@@ -0,0 +1,131 @@
+"""
+Shared health probe registry for the PyroGuard Sentinel API
+
+Both API entry points (main.py and main_simple.py) poll the same external
+services from their /health endpoints; this module keeps the probe list and
+the concurrent fan-out logic in one place instead of hand-rolled try/except
+ladders per service.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from fastapi.responses import ORJSONResponse
+
+from apps.shared.utils.clarifai_ndvi import test_clarifai_connection
+from apps.shared.utils.satellite_client import test_s3_connection
+from apps.shared.utils.satellite_analysis import test_satellite_analysis_systems
+from apps.shared.utils.weather_client import test_noaa_connection
+from apps.shared.utils.overpass_client import test_overpass_connection
+from apps.shared.utils.make_webhook import test_make_webhook
+
+logger = logging.getLogger(__name__)
+
+# (service name, probe callable, is_async); probes returning a dict of
+# per-service status strings are merged into the services map as-is
+Probe = Tuple[str, Callable[[], Any], bool]
+
+PROBE_TIMEOUT = 5.0
+
+# Lets CDNs / proxies collapse rapid health polls without hitting the app
+HEALTH_CACHE_HEADERS = {"Cache-Control": "public, max-age=10"}
+
+
+def health_response(payload: Dict[str, Any]) -> ORJSONResponse:
+    """
+    Wrap a health payload in a response load balancers can act on without
+    parsing JSON: 503 when unhealthy, 200 otherwise (degraded still serves).
+    """
+    status_code = 503 if payload.get("status") == "unhealthy" else 200
+    return ORJSONResponse(content=payload, status_code=status_code, headers=HEALTH_CACHE_HEADERS)
+
+
+# Timestamp string cached for one second - health payloads don't need
+# sub-second precision and strftime is surprisingly expensive at high QPS
+_ts_cache = [0.0, ""]
+
+
+def now_iso() -> str:
+    """ISO-8601 UTC timestamp, recomputed at most once per second"""
+    t = time.time()
+    if t - _ts_cache[0] > 1.0:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.fromtimestamp(t, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _ts_cache[1]
+
+
+async def _probe_satellite_analysis() -> Dict[str, str]:
+    """Expand the combined Clarifai + Anthropic probe into two services"""
+    status = await test_satellite_analysis_systems()
+    return {
+        "clarifai": status.get("clarifai", {}).get("status", "unknown"),
+        "anthropic": status.get("anthropic", {}).get("status", "unknown"),
+    }
+
+
+async def _probe_make_webhook() -> str:
+    status = await test_make_webhook()
+    return status.get("status", "unknown")
+
+
+# Core service probes used by the minimal API entry point (main.py)
+CORE_PROBES: List[Probe] = [
+    ("aws_s3", test_s3_connection, False),
+    ("clarifai", test_clarifai_connection, False),
+    ("noaa", test_noaa_connection, True),
+    ("overpass", test_overpass_connection, False),
+]
+
+# Full sponsor-integration probes used by main_simple.py
+FULL_PROBES: List[Probe] = [
+    ("satellite_analysis", _probe_satellite_analysis, True),
+    ("aws_s3", test_s3_connection, False),
+    ("noaa_weather", test_noaa_connection, True),
+    ("overpass_api", test_overpass_connection, False),
+    ("make_webhook", _probe_make_webhook, True),
+]
+
+
+def _fmt(result: Any) -> str:
+    """Map a probe result (or exception) to a status string"""
+    if isinstance(result, BaseException):
+        # Classify by exception type - stringifying a boto3/requests error can
+        # render a whole response body just to throw away all but 50 chars,
+        # and "ConnectTimeout" tells ops more than a truncated message anyway
+        return f"error: {type(result).__name__}"
+    if isinstance(result, str):
+        return result
+    return "healthy" if result else "degraded"
+
+
+async def run_probes(probes: List[Probe], timeout: float = PROBE_TIMEOUT) -> Dict[str, str]:
+    """
+    Run the given probes concurrently and map each result to a status string.
+
+    Sync probes are pushed off the event loop via asyncio.to_thread; the whole
+    fan-out shares one timeout so a hung dependency cannot stall the caller.
+    """
+    tasks = [
+        probe() if is_async else asyncio.to_thread(probe)
+        for _, probe, is_async in probes
+    ]
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*tasks, return_exceptions=True),
+            timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        results = [TimeoutError("probe timed out")] * len(probes)
+
+    services: Dict[str, str] = {}
+    for (name, _, _), result in zip(probes, results):
+        if isinstance(result, dict):
+            services.update(result)
+        else:
+            services[name] = _fmt(result)
+
+    return services
@@ -1,20 +1,26 @@
 import os
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import uvicorn
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import utilities for health checks
-from apps.shared.utils.clarifai_ndvi import test_clarifai_connection
-from apps.shared.utils.satellite_client import test_s3_connection
-from apps.shared.utils.weather_client import test_noaa_connection
-from apps.shared.utils.overpass_client import test_overpass_connection
+# Import the analysis router
+from apps.api.routers.analyze import router as analyze_router
+
+# Shared health probe registry
+from apps.shared.utils.http_client import aclose_http_client
+from apps.api.health_registry import CORE_PROBES, health_response, now_iso, run_probes
+from apps.api.middleware import SSEExemptGZipMiddleware
+from apps.api.routers.analyze import stop_event_batcher, stop_status_refresher
 
 
 @asynccontextmanager
@@ -24,9 +30,25 @@ async def lifespan(app: FastAPI):
     
     # Startup checks
     logger.info("🔍 Testing external service connections...")
-    
+
+    # Keep the health snapshot warm in the background
+    refresher = asyncio.create_task(_health_refresher())
+
     yield
-    
+
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
+
+    # Stop the /system-status snapshot refresher if a request started it
+    await stop_status_refresher()
+
+    # Flush and stop the Inngest event batcher
+    await stop_event_batcher()
+
+    # Drain the pooled HTTP connections shared by the probes
+    await aclose_http_client()
+
     logger.info("🛑 PyroGuard Sentinel API shutting down...")
 
 
@@ -35,118 +57,170 @@ app = FastAPI(
     title="PyroGuard Sentinel API",
     description="AI-powered wildfire risk assessment system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware - Starlette matches allow_origins by exact string, so
+# "https://*.vercel.app" style wildcards never matched; use a regex instead
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "https://*.vercel.app",
-        "https://*.amplifyapp.com"
-    ],
+    allow_origin_regex=r"^https://([a-z0-9-]+\.)*(vercel\.app|amplifyapp\.com)$|^http://localhost:3000$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["authorization", "content-type", "x-request-id"],
 )
 
+# Compress the larger JSON payloads (/, /sponsor-integrations, /health) -
+# repeated keys compress ~4-6x; tiny responses skip compression entirely.
+# SSE progress streams are exempt: gzip would buffer each frame in zlib
+app.add_middleware(SSEExemptGZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Include routers
+app.include_router(analyze_router, prefix="/api/v1", tags=["analysis"])
+
+
+# Static payload serialized once at import time; the handler is just a
+# memcpy of cached bytes instead of rebuilding and re-encoding the dict
+_ROOT_JSON = orjson.dumps({
+    "name": "PyroGuard Sentinel API",
+    "version": "1.0.0",
+    "description": "AI-powered wildfire risk assessment system",
+    "status": "operational"
+})
+
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "name": "PyroGuard Sentinel API",
-        "version": "1.0.0",
-        "description": "AI-powered wildfire risk assessment system",
-        "status": "operational"
+    return Response(content=_ROOT_JSON, media_type="application/json")
+
+
+# Health snapshot kept warm by a background refresher task so /health is a
+# pure in-memory read regardless of how slow the external services are
+_HEALTH_REFRESH_INTERVAL = 20.0
+_HEALTH_STALE_AFTER = 60.0
+_health_cache = {"ts": 0.0, "payload": None}
+_health_lock = asyncio.Lock()
+
+
+async def _health_refresher():
+    """Periodically re-run the service probes and refresh the snapshot"""
+    while True:
+        try:
+            async with _health_lock:
+                _health_cache["payload"] = await _run_health_checks()
+                _health_cache["ts"] = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Health refresher failed: {str(e)}")
+        await asyncio.sleep(_HEALTH_REFRESH_INTERVAL)
+
+
+async def _run_health_checks():
+    """Run all service probes and build the health status payload"""
+    health_status = {
+        "status": "healthy",
+        "timestamp": now_iso(),
+        "services": {},
+        "environment": {
+            "python_version": "3.11+",
+            "region": os.getenv("AWS_REGION", "us-west-2")
+        }
     }
 
+    # Probe all services concurrently via the shared registry
+    health_status["services"] = await run_probes(CORE_PROBES)
+
+    # Check critical environment variables
+    critical_env_vars = [
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY", 
+        "CLARIFAI_PAT",
+        "INNGEST_EVENT_KEY"
+    ]
+
+    missing_vars = [var for var in critical_env_vars if not os.getenv(var)]
+    if missing_vars:
+        health_status["status"] = "degraded"
+        health_status["missing_env_vars"] = missing_vars
+
+    # Determine overall status
+    service_statuses = list(health_status["services"].values())
+    if any("error" in status for status in service_statuses):
+        health_status["status"] = "degraded"
+
+    return health_status
+
 
 @app.get("/health")
-async def health_check():
+async def health_check(fresh: bool = False):
     """Comprehensive health check endpoint"""
     try:
-        health_status = {
-            "status": "healthy",
-            "timestamp": "2025-01-30T11:35:00Z",
-            "services": {},
-            "environment": {
-                "python_version": "3.11+",
-                "region": os.getenv("AWS_REGION", "us-west-2")
-            }
-        }
-        
-        # Test AWS S3 connection
-        try:
-            s3_healthy = test_s3_connection()
-            health_status["services"]["aws_s3"] = "healthy" if s3_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["aws_s3"] = f"error: {str(e)[:50]}"
-        
-        # Test Clarifai connection
-        try:
-            clarifai_healthy = test_clarifai_connection()
-            health_status["services"]["clarifai"] = "healthy" if clarifai_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["clarifai"] = f"error: {str(e)[:50]}"
-        
-        # Test NOAA connection
-        try:
-            noaa_healthy = test_noaa_connection()
-            health_status["services"]["noaa"] = "healthy" if noaa_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["noaa"] = f"error: {str(e)[:50]}"
-        
-        # Test Overpass connection
-        try:
-            overpass_healthy = test_overpass_connection()
-            health_status["services"]["overpass"] = "healthy" if overpass_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["overpass"] = f"error: {str(e)[:50]}"
-        
-        # Check critical environment variables
-        critical_env_vars = [
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY", 
-            "CLARIFAI_PAT",
-            "INNGEST_EVENT_KEY"
-        ]
-        
-        missing_vars = [var for var in critical_env_vars if not os.getenv(var)]
-        if missing_vars:
-            health_status["status"] = "degraded"
-            health_status["missing_env_vars"] = missing_vars
-        
-        # Determine overall status
-        service_statuses = list(health_status["services"].values())
-        if any("error" in status for status in service_statuses):
-            health_status["status"] = "degraded"
-        
-        return health_status
-    
+        payload = _health_cache["payload"]
+        if not fresh and payload is not None:
+            if time.monotonic() - _health_cache["ts"] > _HEALTH_STALE_AFTER:
+                return health_response({**payload, "status": "stale", "cached": True})
+            return health_response({**payload, "cached": True})
+
+        # Cold start before the first refresh, or an operator forced ?fresh=1.
+        # Single-flight: concurrent refreshes collapse into one probe round.
+        async with _health_lock:
+            if not fresh and _health_cache["payload"] is not None:
+                return health_response({**_health_cache["payload"], "cached": True})
+
+            health_status = await _run_health_checks()
+            _health_cache["payload"] = health_status
+            _health_cache["ts"] = time.monotonic()
+            return health_response(health_status)
+
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": "2025-01-30T11:35:00Z"
+                "timestamp": now_iso()
             }
         )
 
 
-# Import and include routers
-from .routers.analyze import router as analyze_router
-app.include_router(analyze_router, prefix="/api/v1", tags=["analysis"])
+# Liveness/readiness split: /live only says the process is serving requests
+# and never touches a dependency, so transient NOAA/Make outages can't trip
+# an orchestrator into restart loops; /ready reads the cached health verdict
+_LIVE_JSON = orjson.dumps({"status": "ok"})
+_READY_JSON = orjson.dumps({"status": "ready"})
+
+
+@app.get("/live")
+async def liveness():
+    """Liveness probe: returns immediately, no dependency checks"""
+    return Response(content=_LIVE_JSON, media_type="application/json")
+
+
+@app.get("/ready")
+async def readiness():
+    """Readiness probe: serves the cached health snapshot's verdict"""
+    payload = _health_cache["payload"]
+    if payload is None or payload.get("status") not in ("healthy", "degraded"):
+        return ORJSONResponse(
+            status_code=503,
+            content={"status": "not_ready", "timestamp": now_iso()}
+        )
+    return Response(content=_READY_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
+    # Auto-reload only in dev
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8080,
-        reload=True,
+        reload=os.getenv("DEV") == "1",
+        # auto picks uvloop+httptools where installed and falls back to
+        # asyncio+h11 elsewhere (uvloop ships no Windows wheels)
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WORKERS", "1")),
         log_level="info"
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
@@ -1,9 +1,12 @@
 import os
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import uvicorn
 
 # Load environment variables from .env file
@@ -27,66 +30,112 @@ from apps.shared.utils.make_webhook import test_make_webhook
 
 # Import the analysis router
 from apps.api.routers.analyze import router as analyze_router
+from apps.api.routers.analyze import stop_event_batcher, stop_status_refresher
 
+# Shared health probe registry
+from apps.shared.utils.http_client import aclose_http_client
+from apps.api.health_registry import FULL_PROBES, health_response, now_iso, run_probes
+from apps.api.middleware import SSEExemptGZipMiddleware
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan events"""
-    logger.info("🚀 PyroGuard Sentinel API starting up...")
-    
-    # Startup health checks for all sponsor integrations
-    logger.info("🔍 Testing sponsor tool integrations...")
-    
-    # Test Clarifai + Anthropic satellite analysis
-    satellite_status = await test_satellite_analysis_systems()
-    if satellite_status.get("clarifai", {}).get("status") == "configured":
-        logger.info("✅ Clarifai satellite analysis ready")
-    else:
-        logger.warning(f"⚠️ Clarifai: {satellite_status.get('clarifai', {}).get('error', 'Unknown issue')}")
-    
-    if satellite_status.get("anthropic", {}).get("status") == "healthy":
-        logger.info("✅ Anthropic Vision API ready")
+
+# Startup must not block on slow upstreams - if the probes exceed this
+# deadline the app starts anyway and /health reports the real picture later
+STARTUP_PROBE_TIMEOUT = 2.0
+
+
+async def _run_startup_probes():
+    """Probe all sponsor integrations concurrently and log readiness"""
+    # Concurrent fan-out: boot time is the slowest probe, not the sum of five
+    satellite_status, noaa_status, make_status, s3_status, overpass_status = \
+        await asyncio.gather(
+            test_satellite_analysis_systems(),
+            test_noaa_connection(),
+            test_make_webhook(),
+            asyncio.to_thread(test_s3_connection),
+            asyncio.to_thread(test_overpass_connection),
+            return_exceptions=True,
+        )
+
+    # Clarifai + Anthropic satellite analysis
+    if isinstance(satellite_status, BaseException):
+        logger.warning(f"⚠️ Satellite analysis probe failed: {satellite_status}")
     else:
-        logger.warning(f"⚠️ Anthropic: {satellite_status.get('anthropic', {}).get('error', 'Unknown issue')}")
-    
-    # Test NOAA Weather Service
-    noaa_status = await test_noaa_connection()
-    if noaa_status:
+        if satellite_status.get("clarifai", {}).get("status") == "configured":
+            logger.info("✅ Clarifai satellite analysis ready")
+        else:
+            logger.warning(f"⚠️ Clarifai: {satellite_status.get('clarifai', {}).get('error', 'Unknown issue')}")
+
+        if satellite_status.get("anthropic", {}).get("status") == "healthy":
+            logger.info("✅ Anthropic Vision API ready")
+        else:
+            logger.warning(f"⚠️ Anthropic: {satellite_status.get('anthropic', {}).get('error', 'Unknown issue')}")
+
+    # NOAA Weather Service
+    if not isinstance(noaa_status, BaseException) and noaa_status:
         logger.info("✅ NOAA Weather Service ready")
     else:
         logger.warning("⚠️ NOAA Weather Service connection issues")
-    
-    # Test Make.com webhook
-    make_status = await test_make_webhook()
-    if make_status.get("status") == "healthy":
+
+    # Make.com webhook
+    if isinstance(make_status, BaseException):
+        logger.warning(f"⚠️ Make.com webhook: {make_status}")
+    elif make_status.get("status") == "healthy":
         logger.info("✅ Make.com webhook integration ready")
     else:
         logger.warning(f"⚠️ Make.com webhook: {make_status.get('error', 'Unknown issue')}")
-    
-    # Test AWS S3 for satellite imagery
-    try:
-        s3_status = test_s3_connection()
-        if s3_status:
-            logger.info("✅ AWS S3 satellite imagery access ready")
-        else:
-            logger.warning("⚠️ AWS S3 connection issues")
-    except Exception as e:
-        logger.warning(f"⚠️ AWS S3: {str(e)}")
-    
-    # Test OpenStreetMap Overpass API
+
+    # AWS S3 for satellite imagery
+    if isinstance(s3_status, BaseException):
+        logger.warning(f"⚠️ AWS S3: {str(s3_status)}")
+    elif s3_status:
+        logger.info("✅ AWS S3 satellite imagery access ready")
+    else:
+        logger.warning("⚠️ AWS S3 connection issues")
+
+    # OpenStreetMap Overpass API
+    if isinstance(overpass_status, BaseException):
+        logger.warning(f"⚠️ Overpass API: {str(overpass_status)}")
+    elif overpass_status:
+        logger.info("✅ OpenStreetMap Overpass API ready")
+    else:
+        logger.warning("⚠️ OpenStreetMap Overpass API connection issues")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events"""
+    logger.info("🚀 PyroGuard Sentinel API starting up...")
+
+    # Startup health checks for all sponsor integrations
+    logger.info("🔍 Testing sponsor tool integrations...")
     try:
-        overpass_status = test_overpass_connection()
-        if overpass_status:
-            logger.info("✅ OpenStreetMap Overpass API ready")
-        else:
-            logger.warning("⚠️ OpenStreetMap Overpass API connection issues")
-    except Exception as e:
-        logger.warning(f"⚠️ Overpass API: {str(e)}")
-    
+        await asyncio.wait_for(_run_startup_probes(), timeout=STARTUP_PROBE_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"⚠️ Startup probes exceeded {STARTUP_PROBE_TIMEOUT}s deadline - "
+            "starting anyway, /health will reflect integration status"
+        )
+
     logger.info("🌟 PyroGuard Sentinel ready for wildfire risk assessment!")
-    
+
+    # Keep the health snapshot warm in the background
+    refresher = asyncio.create_task(_health_refresher())
+
     yield
-    
+
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
+
+    # Stop the /system-status snapshot refresher if a request started it
+    await stop_status_refresher()
+
+    # Flush and stop the Inngest event batcher
+    await stop_event_batcher()
+
+    # Drain the pooled HTTP connections shared by the integrations
+    await aclose_http_client()
+
     logger.info("🛑 PyroGuard Sentinel API shutting down...")
 
 
@@ -95,237 +144,270 @@ app = FastAPI(
     title="PyroGuard Sentinel API",
     description="AI-powered wildfire risk assessment system for Hawaiian Islands with sponsor tool integrations",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware - Starlette matches allow_origins by exact string, so
+# "https://*.vercel.app" style wildcards never matched; use a regex instead
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3001",
-        "https://*.vercel.app",
-        "https://*.amplifyapp.com"
-    ],
+    allow_origin_regex=r"^https://([a-z0-9-]+\.)*(vercel\.app|amplifyapp\.com)$|^http://localhost:(3000|3001)$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["authorization", "content-type", "x-request-id"],
 )
 
+# Compress the larger JSON payloads (/, /sponsor-integrations, /health) -
+# repeated keys compress ~4-6x; tiny responses skip compression entirely.
+# SSE progress streams are exempt: gzip would buffer each frame in zlib
+app.add_middleware(SSEExemptGZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Include routers
 app.include_router(analyze_router, prefix="/api/v1", tags=["analysis"])
 
 
+# Static payloads serialized once at import time; these endpoints have no
+# runtime inputs, so the handlers just return cached bytes
+_ROOT_JSON = orjson.dumps({
+    "name": "PyroGuard Sentinel API",
+    "version": "1.0.0", 
+    "description": "AI-powered wildfire risk assessment system for Hawaiian Islands",
+    "status": "operational",
+    "mode": "production",
+    "sponsor_integrations": {
+        "satellite_analysis": "Clarifai + Anthropic Vision API",
+        "weather_service": "NOAA Weather Service", 
+        "power_infrastructure": "OpenStreetMap Overpass API",
+        "satellite_imagery": "AWS S3 Sentinel-2",
+        "incident_automation": "Make.com → Jira",
+        "job_orchestration": "Inngest"
+    },
+    "features": [
+        "Real-time wildfire risk analysis with AI reasoning",
+        "7-phase comprehensive analysis pipeline",
+        "Hawaiian Islands full coverage",
+        "Multi-source environmental data integration",
+        "Automated incident response workflows",
+        "Server-sent events for real-time progress tracking",
+        "Demo mode with cached responses"
+    ],
+    "endpoints": {
+        "health": "/health",
+        "docs": "/docs",
+        "analysis": "/api/v1/analyze",
+        "demo_locations": "/api/v1/demo-locations",
+        "system_status": "/api/v1/system-status"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "name": "PyroGuard Sentinel API",
-        "version": "1.0.0", 
-        "description": "AI-powered wildfire risk assessment system for Hawaiian Islands",
-        "status": "operational",
-        "mode": "production",
-        "sponsor_integrations": {
-            "satellite_analysis": "Clarifai + Anthropic Vision API",
-            "weather_service": "NOAA Weather Service", 
-            "power_infrastructure": "OpenStreetMap Overpass API",
-            "satellite_imagery": "AWS S3 Sentinel-2",
-            "incident_automation": "Make.com → Jira",
-            "job_orchestration": "Inngest"
+    return Response(content=_ROOT_JSON, media_type="application/json")
+
+
+# Health snapshot kept warm by a background refresher task so /health is a
+# pure in-memory read regardless of how slow the sponsor integrations are
+_HEALTH_REFRESH_INTERVAL = 20.0
+_HEALTH_STALE_AFTER = 60.0
+_health_cache = {"ts": 0.0, "payload": None}
+_health_lock = asyncio.Lock()
+
+
+async def _health_refresher():
+    """Periodically re-run the sponsor probes and refresh the snapshot"""
+    while True:
+        try:
+            async with _health_lock:
+                _health_cache["payload"] = await _run_health_checks()
+                _health_cache["ts"] = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Health refresher failed: {str(e)}")
+        await asyncio.sleep(_HEALTH_REFRESH_INTERVAL)
+
+
+async def _run_health_checks():
+    """Run all sponsor probes and build the health status payload"""
+    health_status = {
+        "status": "healthy",
+        "timestamp": now_iso(),
+        "services": {},
+        "environment": {
+            "python_version": "3.11+",
+            "region": os.getenv("AWS_REGION", "us-west-2"),
+            "mode": "production"
         },
-        "features": [
-            "Real-time wildfire risk analysis with AI reasoning",
-            "7-phase comprehensive analysis pipeline",
-            "Hawaiian Islands full coverage",
-            "Multi-source environmental data integration",
-            "Automated incident response workflows",
-            "Server-sent events for real-time progress tracking",
-            "Demo mode with cached responses"
-        ],
-        "endpoints": {
-            "health": "/health",
-            "docs": "/docs",
-            "analysis": "/api/v1/analyze",
-            "demo_locations": "/api/v1/demo-locations",
-            "system_status": "/api/v1/system-status"
+        "features": {
+            "analysis_pipeline": "operational",
+            "real_time_progress": "operational",
+            "sponsor_integrations": "operational",
+            "hawaii_coverage": "full"
         }
     }
+    
+    # Probe all sponsor integrations concurrently via the shared registry
+    health_status["services"] = await run_probes(FULL_PROBES)
+    
+    # Check critical environment variables
+    critical_env_vars = [
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "ANTHROPIC_API_KEY",
+        "CLARIFAI_PAT",
+        "MAKE_WEBHOOK_URL"
+    ]
+    
+    missing_vars = [var for var in critical_env_vars if not os.getenv(var)]
+    if missing_vars:
+        health_status["status"] = "degraded"
+        health_status["missing_env_vars"] = missing_vars
+    
+    # Determine overall status
+    service_statuses = list(health_status["services"].values())
+    if any("error" in str(status) for status in service_statuses):
+        health_status["status"] = "degraded"
+    
+    # Add sponsor integration summary
+    health_status["sponsor_integration_summary"] = {
+        "satellite_analysis": "Clarifai + Anthropic fallback",
+        "weather_data": "NOAA Weather Service API",
+        "power_infrastructure": "OpenStreetMap Overpass API", 
+        "satellite_imagery": "AWS S3 Sentinel-2",
+        "incident_automation": "Make.com webhook → Jira",
+        "total_integrations": 5,
+        "operational_integrations": len([s for s in service_statuses if "healthy" in str(s) or "configured" in str(s)])
+    }
+    
+    return health_status
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(fresh: bool = False):
     """Comprehensive health check endpoint for all sponsor integrations"""
     try:
-        health_status = {
-            "status": "healthy",
-            "timestamp": "2025-01-30T12:00:00Z",
-            "services": {},
-            "environment": {
-                "python_version": "3.11+",
-                "region": os.getenv("AWS_REGION", "us-west-2"),
-                "mode": "production"
-            },
-            "features": {
-                "analysis_pipeline": "operational",
-                "real_time_progress": "operational",
-                "sponsor_integrations": "operational",
-                "hawaii_coverage": "full"
-            }
-        }
-        
-        # Test Clarifai + Anthropic satellite analysis
-        try:
-            satellite_status = await test_satellite_analysis_systems()
-            health_status["services"]["clarifai"] = satellite_status.get("clarifai", {}).get("status", "unknown")
-            health_status["services"]["anthropic"] = satellite_status.get("anthropic", {}).get("status", "unknown")
-        except Exception as e:
-            health_status["services"]["clarifai"] = f"error: {str(e)[:50]}"
-            health_status["services"]["anthropic"] = f"error: {str(e)[:50]}"
-        
-        # Test AWS S3 connection
-        try:
-            s3_healthy = test_s3_connection()
-            health_status["services"]["aws_s3"] = "healthy" if s3_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["aws_s3"] = f"error: {str(e)[:50]}"
-        
-        # Test NOAA Weather Service
-        try:
-            noaa_healthy = await test_noaa_connection()
-            health_status["services"]["noaa_weather"] = "healthy" if noaa_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["noaa_weather"] = f"error: {str(e)[:50]}"
-        
-        # Test OpenStreetMap Overpass API
-        try:
-            overpass_healthy = test_overpass_connection()
-            health_status["services"]["overpass_api"] = "healthy" if overpass_healthy else "degraded"
-        except Exception as e:
-            health_status["services"]["overpass_api"] = f"error: {str(e)[:50]}"
-        
-        # Test Make.com webhook
-        try:
-            make_status = await test_make_webhook()
-            health_status["services"]["make_webhook"] = make_status.get("status", "unknown")
-        except Exception as e:
-            health_status["services"]["make_webhook"] = f"error: {str(e)[:50]}"
-        
-        # Check critical environment variables
-        critical_env_vars = [
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "ANTHROPIC_API_KEY",
-            "CLARIFAI_PAT",
-            "MAKE_WEBHOOK_URL"
-        ]
-        
-        missing_vars = [var for var in critical_env_vars if not os.getenv(var)]
-        if missing_vars:
-            health_status["status"] = "degraded"
-            health_status["missing_env_vars"] = missing_vars
-        
-        # Determine overall status
-        service_statuses = list(health_status["services"].values())
-        if any("error" in str(status) for status in service_statuses):
-            health_status["status"] = "degraded"
-        
-        # Add sponsor integration summary
-        health_status["sponsor_integration_summary"] = {
-            "satellite_analysis": "Clarifai + Anthropic fallback",
-            "weather_data": "NOAA Weather Service API",
-            "power_infrastructure": "OpenStreetMap Overpass API", 
-            "satellite_imagery": "AWS S3 Sentinel-2",
-            "incident_automation": "Make.com webhook → Jira",
-            "total_integrations": 5,
-            "operational_integrations": len([s for s in service_statuses if "healthy" in str(s) or "configured" in str(s)])
-        }
-        
-        return health_status
-    
+        payload = _health_cache["payload"]
+        if not fresh and payload is not None:
+            if time.monotonic() - _health_cache["ts"] > _HEALTH_STALE_AFTER:
+                return health_response({**payload, "status": "stale", "cached": True})
+            return health_response({**payload, "cached": True})
+
+        # Cold start before the first refresh, or an operator forced ?fresh=1.
+        # Single-flight: concurrent refreshes collapse into one probe round.
+        async with _health_lock:
+            if not fresh and _health_cache["payload"] is not None:
+                return health_response({**_health_cache["payload"], "cached": True})
+
+            health_status = await _run_health_checks()
+            _health_cache["payload"] = health_status
+            _health_cache["ts"] = time.monotonic()
+            return health_response(health_status)
+
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": "2025-01-30T12:00:00Z"
+                "timestamp": now_iso()
             }
         )
 
 
-@app.get("/sponsor-integrations")
-async def get_sponsor_integrations():
-    """Get detailed information about all sponsor tool integrations"""
-    return {
-        "pyroguard_sentinel": {
-            "description": "AI-powered wildfire risk assessment for Hawaiian Islands",
-            "version": "1.0.0"
+_SPONSOR_JSON = orjson.dumps({
+    "pyroguard_sentinel": {
+        "description": "AI-powered wildfire risk assessment for Hawaiian Islands",
+        "version": "1.0.0"
+    },
+    "integrations": {
+        "clarifai": {
+            "purpose": "Primary satellite image analysis for vegetation dryness",
+            "model": "Crop Health NDVI",
+            "status": "active",
+            "fallback": "anthropic_vision"
         },
-        "integrations": {
-            "clarifai": {
-                "purpose": "Primary satellite image analysis for vegetation dryness",
-                "model": "Crop Health NDVI",
-                "status": "active",
-                "fallback": "anthropic_vision"
-            },
-            "anthropic": {
-                "purpose": "Fallback satellite image analysis using Vision API",
-                "model": "Claude 3 Sonnet",
-                "status": "active",
-                "role": "fallback_for_clarifai"
-            },
-            "noaa": {
-                "purpose": "Real-time weather data and forecasting",
-                "api": "Weather.gov API",
-                "status": "active",
-                "coverage": "Hawaiian Islands"
-            },
-            "aws": {
-                "purpose": "Satellite imagery storage and access",
-                "service": "S3 + Sentinel-2",
-                "status": "active",
-                "region": "us-west-2"
-            },
-            "openstreetmap": {
-                "purpose": "Power line infrastructure mapping",
-                "api": "Overpass API",
-                "status": "active",
-                "data_source": "OpenStreetMap"
-            },
-            "make_com": {
-                "purpose": "Automated workflow for incident response",
-                "integration": "Webhook → Jira ticket creation",
-                "status": "active",
-                "target": "Jira Cloud"
-            },
-            "inngest": {
-                "purpose": "Job queue and workflow orchestration",
-                "status": "configured",
-                "fallback": "direct_execution"
-            }
+        "anthropic": {
+            "purpose": "Fallback satellite image analysis using Vision API",
+            "model": "Claude 3 Sonnet",
+            "status": "active",
+            "role": "fallback_for_clarifai"
         },
-        "analysis_pipeline": {
-            "phases": [
-                {"phase": 1, "name": "Location Verification", "sponsor": "internal"},
-                {"phase": 2, "name": "Satellite Analysis", "sponsor": "clarifai_anthropic"},
-                {"phase": 3, "name": "Weather Integration", "sponsor": "noaa"},
-                {"phase": 4, "name": "Power Infrastructure", "sponsor": "openstreetmap"},
-                {"phase": 5, "name": "AI Risk Assessment", "sponsor": "internal_mcp_agent"},
-                {"phase": 6, "name": "Incident Automation", "sponsor": "make_com_jira"},
-                {"phase": 7, "name": "Complete", "sponsor": "internal"}
-            ],
-            "total_processing_time": "4-12 seconds",
-            "real_time_updates": "Server-Sent Events"
+        "noaa": {
+            "purpose": "Real-time weather data and forecasting",
+            "api": "Weather.gov API",
+            "status": "active",
+            "coverage": "Hawaiian Islands"
+        },
+        "aws": {
+            "purpose": "Satellite imagery storage and access",
+            "service": "S3 + Sentinel-2",
+            "status": "active",
+            "region": "us-west-2"
+        },
+        "openstreetmap": {
+            "purpose": "Power line infrastructure mapping",
+            "api": "Overpass API",
+            "status": "active",
+            "data_source": "OpenStreetMap"
+        },
+        "make_com": {
+            "purpose": "Automated workflow for incident response",
+            "integration": "Webhook → Jira ticket creation",
+            "status": "active",
+            "target": "Jira Cloud"
+        },
+        "inngest": {
+            "purpose": "Job queue and workflow orchestration",
+            "status": "configured",
+            "fallback": "direct_execution"
         }
+    },
+    "analysis_pipeline": {
+        "phases": [
+            {"phase": 1, "name": "Location Verification", "sponsor": "internal"},
+            {"phase": 2, "name": "Satellite Analysis", "sponsor": "clarifai_anthropic"},
+            {"phase": 3, "name": "Weather Integration", "sponsor": "noaa"},
+            {"phase": 4, "name": "Power Infrastructure", "sponsor": "openstreetmap"},
+            {"phase": 5, "name": "AI Risk Assessment", "sponsor": "internal_mcp_agent"},
+            {"phase": 6, "name": "Incident Automation", "sponsor": "make_com_jira"},
+            {"phase": 7, "name": "Complete", "sponsor": "internal"}
+        ],
+        "total_processing_time": "4-12 seconds",
+        "real_time_updates": "Server-Sent Events"
     }
+})
+
+
+@app.get("/sponsor-integrations")
+async def get_sponsor_integrations():
+    """Get detailed information about all sponsor tool integrations"""
+    # Fully static payload - let browsers/CDNs hold it for an hour
+    return Response(
+        content=_SPONSOR_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+
+def _test_passed(result) -> bool:
+    """A test counts as passing if the service itself, or either satellite
+    analysis backend (Clarifai primary / Anthropic fallback), reports ready"""
+    if not isinstance(result, dict):
+        return False
+    return (
+        result.get("status") in ("healthy", "configured")
+        or result.get("clarifai", {}).get("status") == "configured"
+        or result.get("anthropic", {}).get("status") == "healthy"
+    )
 
 
 @app.post("/api/v1/test-integrations")
 async def test_all_integrations():
     """Test all sponsor tool integrations comprehensively"""
     results = {
-        "timestamp": "2025-01-30T12:00:00Z",
+        "timestamp": now_iso(),
         "tests": {}
     }
     
@@ -359,19 +441,10 @@ async def test_all_integrations():
             "service": "OpenStreetMap Overpass API"
         }
         
-        # Count successful tests
-        successful_tests = 0
+        # Count successful tests - one pass, no repeated key checks
+        successful_tests = sum(_test_passed(v) for v in results["tests"].values())
         total_tests = len(results["tests"])
-        
-        for test_name, test_result in results["tests"].items():
-            if isinstance(test_result, dict):
-                if test_result.get("status") in ["healthy", "configured"]:
-                    successful_tests += 1
-                elif "clarifai" in test_result and test_result["clarifai"].get("status") == "configured":
-                    successful_tests += 1
-                elif "anthropic" in test_result and test_result["anthropic"].get("status") == "healthy":
-                    successful_tests += 1
-        
+
         results["summary"] = {
             "total_integrations": total_tests,
             "successful_tests": successful_tests,
@@ -383,7 +456,7 @@ async def test_all_integrations():
         
     except Exception as e:
         return {
-            "timestamp": "2025-01-30T12:00:00Z",
+            "timestamp": now_iso(),
             "error": str(e),
             "status": "test_failed"
         }
@@ -397,10 +470,16 @@ if __name__ == "__main__":
     
     logger.info("🔥 Starting PyroGuard Sentinel API...")
     
+    # Auto-reload only in dev
     uvicorn.run(
         "apps.api.main_simple:app",
         host="0.0.0.0",
         port=8082,
-        reload=True,
+        reload=os.getenv("DEV") == "1",
+        # auto picks uvloop+httptools where installed and falls back to
+        # asyncio+h11 elsewhere (uvloop ships no Windows wheels)
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WORKERS", "1")),
         log_level="info"
-    ) 
\ No newline at end of file
+    )
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Shared ASGI middleware for the PyroGuard API apps
+"""
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
+
+
+class SSEExemptGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes Server-Sent Event streams through untouched
+
+    Starlette's GZipResponder compresses streamed bodies regardless of
+    content type, and minimum_size only applies to non-streamed responses -
+    so each small SSE progress frame would sit in the zlib buffer instead of
+    reaching the client until enough bytes accumulate or the stream closes.
+    Requests negotiating an event stream skip compression entirely; every
+    other response keeps the normal gzip behavior.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            accept = Headers(scope=scope).get("accept", "")
+            if "text/event-stream" in accept:
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
@@ -1,33 +1,308 @@
 import os
+import hashlib
+import time
 import uuid
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional
-import json
+from datetime import datetime, timezone
+from typing import Dict, Any, Final, Optional, Set
 from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse
+import orjson
+
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from sse_starlette.sse import EventSourceResponse
 import httpx
 
-from apps.shared.models.risk_inputs import AnalysisRequest, AnalysisResult, WorkerEvent
-from apps.shared.utils.satellite_client import is_in_hawaii, get_satellite_image_bytes, test_s3_connection
+from apps.shared.models.risk_inputs import (
+    AnalysisRequest,
+    AnalysisResult,
+    PowerLineData,
+    RiskAssessment,
+    SatelliteData,
+    WeatherData,
+    WorkerEvent,
+)
+from apps.shared.utils.satellite_client import get_satellite_image_bytes, test_s3_connection
 from apps.shared.utils.satellite_analysis import analyze_with_clarifai, test_satellite_analysis_systems
-from apps.shared.utils.weather_client import get_weather_data, test_noaa_connection
+from apps.shared.utils.weather_client import get_weather_data, test_noaa_connection, test_noaa_status
 from apps.shared.utils.overpass_client import get_power_line_data, create_demo_power_data, test_overpass_connection
 from apps.shared.utils.make_webhook import send_wildfire_analysis_to_make, test_make_webhook
+from apps.shared.utils.http_client import get_http_client
+from apps.shared.utils.analysis_store import AnalysisStore
+from apps.shared.utils.circuit_breaker import AsyncCircuitBreaker, CircuitOpenError
+from apps.shared.utils.tile_cache import TileCache
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# orjson response class even when the router is mounted on an app that did
+# not set it as default - the result payloads are float-heavy nested dicts
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Redis-backed result store with in-memory fallback; lets multiple workers
+# serve /progress and /result for any analysis and expires old entries
+analysis_store = AnalysisStore()
+
+# Sub-result cache keyed by ~1 km tile; TTLs match each source's freshness
+tile_cache = TileCache()
+
+SATELLITE_CACHE_TTL = 6 * 3600   # Sentinel-2 revisit is days, dryness drifts slowly
+WEATHER_CACHE_TTL = 600          # NOAA observations update every few minutes
+POWER_CACHE_TTL = 24 * 3600
+
+# /system-status cache: monitoring and load balancers poll the endpoint far
+# more often than upstream health actually changes, so probe results are
+# reused for a short TTL and concurrent misses coalesce behind one refresh.
+# The snapshot stays a plain dict encoded once per refresh with orjson: with
+# at most one encode per TTL window, a schema-compiled serializer (msgspec,
+# Pydantic fast-path) would shave nothing measurable off the request path
+_STATUS_TTL = float(os.getenv("SYSTEM_STATUS_TTL", "30"))
+_STATUS_PROBE_TIMEOUT = float(os.getenv("SYSTEM_STATUS_PROBE_TIMEOUT", "5"))
+_STATUS_CACHE: Dict[str, Any] = {"ts": 0.0, "payload": None, "body": None, "etag": None, "unhealthy": False}
+
+# Optional push channel: on a health transition the refresher POSTs here so
+# consumers can subscribe to degradation instead of polling /system-status
+_STATUS_WEBHOOK_URL = os.getenv("STATUS_WEBHOOK_URL")
+_status_refresh_future: Optional[asyncio.Future] = None
+_status_refresher_task: Optional[asyncio.Task] = None
+
+# Upper bound on concurrently running health probes: a burst of uncached
+# status paths can't pile 3N sockets onto NOAA/Make at once
+_PROBE_SEM = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_HEALTH_CHECKS", "10")))
+
+# Satellite imagery is analyzed at parent-tile granularity: requests are
+# rounded to a ~2 km grid so neighboring clicks resolve to one cached
+# analysis instead of separate Clarifai/Anthropic runs per coordinate
+SATELLITE_PARENT_STEP = 0.02
+
+# Hawaiian Islands bounding box (same envelope satellite_client.is_in_hawaii
+# uses), inlined so the hot request path is a single chained comparison. The
+# bbox is the full containment check here - no polygon or geodesic pass
+# follows it - so out-of-area requests are rejected in sub-microseconds and
+# the deeper satellite/Overpass code only ever sees in-bounds coordinates
+_HI_MIN_LAT, _HI_MAX_LAT = 18.9, 22.2
+_HI_MIN_LON, _HI_MAX_LON = -160.3, -154.8      # OSM power infrastructure is effectively static
+
+# Per-analysis subscriber queues for event-driven SSE: the pipeline publishes
+# a snapshot whenever a phase lands and every connected progress stream
+# awaits its own queue, instead of every client re-polling the store twice a
+# second. A set per analysis so concurrent clients don't evict each other
+progress_queues: Dict[str, Set[asyncio.Queue]] = {}
+
+# Stream bounds: give up after a quiet minute (the pipeline publishes every
+# few seconds while alive) and hard-cap the stream's total wall time
+_SSE_IDLE_TIMEOUT = 60.0
+_SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "300"))
+
+# Identifies events this process published to Redis, so the relay doesn't
+# re-deliver what the pipeline already queued locally
+_PROCESS_ID = uuid.uuid4().hex
+
+# Phase bits recorded on AnalysisResult.phases_done as the pipeline advances;
+# cheaper to test than probing optional attributes and they travel with the
+# result through the store to other workers
+P_SATELLITE = 1
+P_WEATHER = 2
+P_POWER = 4
+P_RISK = 8
+P_TICKET = 16
+
+# Field dispatch for the worker update endpoint: sub-result payloads get
+# validated into their model with the matching phase bit, scalars are copied
+# straight onto the result (jira_ticket_url is the one scalar with a bit)
+_UPDATE_MODEL_FIELDS = {
+    "weather": (WeatherData, P_WEATHER),
+    "satellite": (SatelliteData, P_SATELLITE),
+    "power_lines": (PowerLineData, P_POWER),
+    "risk_assessment": (RiskAssessment, P_RISK),
+}
+_UPDATE_SCALAR_FIELDS = {
+    "status": 0,
+    "processing_time_seconds": 0,
+    "jira_ticket_url": P_TICKET,
+    "error_message": 0,
+}
+
+# Shared secret for the worker update endpoint: callers presenting it get
+# the model_construct fast path (the worker built these payloads from
+# already-validated models); everything else runs full pydantic validation
+_INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+
+def _progress_payload(analysis_id: str, result: AnalysisResult) -> Dict[str, Any]:
+    """Build the incremental progress snapshot sent over SSE
+
+    Phase presence is tested against the phases_done bitmap - one int AND
+    per phase instead of hasattr/None probing on optional attributes - and
+    the payload is built once per published phase event, not per poll tick,
+    since the SSE loop is event-driven.
+    """
+    progress_data = {
+        "type": "progress",
+        "analysis_id": analysis_id,
+        "status": result.status,
+        "processing_time": result.processing_time_seconds,
+        "timestamp": datetime.now().isoformat()
+    }
+
+    phases = result.phases_done
+
+    if phases & P_WEATHER:
+        progress_data["weather"] = {
+            "temperature_f": result.weather.temperature_f,
+            "humidity_percent": result.weather.humidity_percent,
+            "wind_speed_mph": result.weather.wind_speed_mph,
+            "conditions": result.weather.conditions
+        }
 
-# In-memory storage for analysis results (in production, use Redis)
-analysis_results: Dict[str, AnalysisResult] = {}
+    if phases & P_SATELLITE:
+        progress_data["satellite"] = {
+            "dryness_score": result.satellite.dryness_score,
+            "confidence": result.satellite.confidence,
+            "tile_date": result.satellite.tile_date
+        }
+
+    if phases & P_POWER:
+        progress_data["power_lines"] = {
+            "count": result.power_lines.count,
+            "nearest_distance_m": result.power_lines.nearest_distance_m
+        }
+
+    if phases & P_RISK:
+        progress_data["risk_assessment"] = {
+            "risk_level": result.risk_assessment.risk_level,
+            "severity": result.risk_assessment.severity,
+            "rationale": result.risk_assessment.rationale,
+            "confidence": result.risk_assessment.confidence
+        }
+
+    if phases & P_TICKET:
+        progress_data["jira_ticket_url"] = result.jira_ticket_url
+
+    return progress_data
+
+
+def _sse(payload: Dict[str, Any]) -> str:
+    """Serialize an SSE data payload with orjson; EventSourceResponse adds
+    the framing and keepalive pings"""
+    return orjson.dumps(payload).decode()
+
+
+async def _persist_and_publish(analysis_id: str, result: AnalysisResult) -> None:
+    """Write a phase result through the store and broadcast it in one step
+
+    The cross-worker PUBLISH rides the same Redis pipeline as the SET, so
+    each phase costs one round-trip instead of two; the local SSE queue is
+    fed directly either way.
+    """
+    payload = _progress_payload(analysis_id, result)
+    event = None
+    if analysis_store.has_redis:
+        event = orjson.dumps({**payload, "src": _PROCESS_ID}).decode()
+    await analysis_store.set(analysis_id, result, event=event)
+    for queue in progress_queues.get(analysis_id, ()):
+        queue.put_nowait(payload)
+
+
+def _publish_complete(analysis_id: str, status: str) -> None:
+    """Push the terminal SSE event for a finished or failed analysis"""
+    payload = {
+        "type": "complete",
+        "status": status,
+        "timestamp": datetime.now().isoformat()
+    }
+    for queue in progress_queues.get(analysis_id, ()):
+        queue.put_nowait(payload)
+    _broadcast_event(analysis_id, payload)
+
+
+# Strong references for fire-and-forget tasks: the event loop keeps only
+# weak refs, so a detached task can be garbage-collected mid-flight
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """create_task that stays referenced until the task completes"""
+    task = asyncio.get_running_loop().create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+
+def _broadcast_event(analysis_id: str, payload: Dict[str, Any]) -> None:
+    """Mirror an SSE payload to Redis so clients on other workers see it"""
+    if not analysis_store.has_redis:
+        return
+    message = orjson.dumps({**payload, "src": _PROCESS_ID}).decode()
+    _spawn(analysis_store.publish_event(analysis_id, message))
+
+
+async def _forward_remote_events(analysis_id: str, queue: asyncio.Queue) -> None:
+    """Relay events published by other workers into the local SSE queue"""
+    pubsub = await analysis_store.subscribe_events(analysis_id)
+    if pubsub is None:
+        return
+    try:
+        async for message in pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                payload = orjson.loads(message["data"])
+            except Exception:
+                continue
+            # Skip events that originated here - already queued locally
+            if payload.pop("src", None) == _PROCESS_ID:
+                continue
+            queue.put_nowait(payload)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning("⚠️ Remote event relay failed for %s: %s", analysis_id, e)
+    finally:
+        try:
+            await pubsub.close()
+        except Exception:
+            pass
 
 # Inngest configuration
 INNGEST_EVENT_KEY = os.getenv("INNGEST_EVENT_KEY")
 INNGEST_BASE_URL = "https://api.inngest.com"
+_INNGEST_HEADERS = {
+    "Authorization": f"Bearer {INNGEST_EVENT_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Demo pacing schedule (seconds per phase), declared once: the sleeps exist
+# purely so the demo UI animates through the phases - entries 1-3 stagger
+# the publishes of the concurrent satellite/weather/power phases.
+# Production analyses skip them entirely and are bound only by real I/O
+_DEMO_DELAYS = (0.2, 0.8, 0.5, 0.4, 0.6, 1.0, 0.3)
+
+# How long phase 7 waits for the concurrent Make.com ticket before emitting
+# the terminal frame - that frame closes every progress stream, so a ticket
+# landing after it would never reach the UI
+_TICKET_COMPLETE_GRACE = float(os.getenv("TICKET_COMPLETE_GRACE", "10"))
+
+# Static fragments of the /analyze response, built once instead of per
+# request. Kept a plain dict (not MappingProxyType) because orjson refuses
+# mappingproxy values; Final marks the no-rebinding intent
+SPONSOR_INTEGRATIONS: Final = {
+    "satellite_analysis": "Clarifai + Anthropic Vision API",
+    "weather_data": "NOAA Weather Service",
+    "power_infrastructure": "OpenStreetMap Overpass API",
+    "incident_automation": "Make.com → Jira"
+}
+
+ANALYSIS_PHASES: Final = (
+    "Location Verification",
+    "Satellite Image Analysis (Clarifai/Anthropic)",
+    "Weather Data Integration (NOAA)",
+    "Power Infrastructure Analysis (OpenStreetMap)",
+    "AI Risk Assessment (MCP Agent Reasoning)",
+    "Incident Automation (Make.com → Jira)",
+    "Complete"
+)
 
 # MCP (Model Context Protocol) Configuration
 MCP_SERVER_INFO = {
@@ -123,6 +398,116 @@ MCP_TOOLS = [
 ]
 
 
+# Risk-factor threshold table, built once at import: each entry maps a
+# predicate over the extracted inputs to the label it contributes. One pass
+# over this table replaces the branch ladders in the assessment hot path.
+# The conditions string is lowercased exactly once when the inputs dict is
+# built; the two substring scans below stay as `in` checks because CPython's
+# substring search beats a compiled alternation at these string lengths.
+_RISK_FACTOR_RULES = (
+    (lambda f: f["dryness"] > 0.8, "critically dry vegetation"),
+    (lambda f: 0.6 < f["dryness"] <= 0.8, "moderately dry vegetation"),
+    (lambda f: 0.4 < f["dryness"] <= 0.6, "slightly dry vegetation"),
+    (lambda f: f["temperature_f"] > 85, "high temperature"),
+    (lambda f: f["humidity_percent"] < 40, "low humidity"),
+    (lambda f: f["wind_speed_mph"] > 20, "strong winds"),
+    (lambda f: "dry" in f["conditions"] or "clear" in f["conditions"], "dry weather conditions"),
+    (lambda f: f["power_count"] > 0 and f["nearest_power_m"] < 100, "very close power lines"),
+    (lambda f: f["power_count"] > 0 and 100 <= f["nearest_power_m"] < 300, "nearby power infrastructure"),
+    (lambda f: f["power_count"] > 5, "dense power line network"),
+)
+
+
+# Micro-batched event posting: the Inngest /v1/events endpoint accepts an
+# array, so events arriving within a short window coalesce into one POST over
+# the warm pooled connection instead of N concurrent round-trips
+_EVENT_BATCH_WINDOW = 0.05
+_EVENT_BATCH_MAX = 64
+_event_buffer: Optional[asyncio.Queue] = None
+_event_batcher_task: Optional[asyncio.Task] = None
+
+
+def _get_event_buffer() -> asyncio.Queue:
+    """Return the event queue, starting the batcher task on first use"""
+    global _event_buffer, _event_batcher_task
+    if _event_buffer is None:
+        _event_buffer = asyncio.Queue()
+    if _event_batcher_task is None or _event_batcher_task.done():
+        _event_batcher_task = asyncio.get_running_loop().create_task(_drain_event_buffer())
+    return _event_buffer
+
+
+async def _drain_event_buffer() -> None:
+    """Coalesce queued Inngest events into array POSTs to /v1/events"""
+    queue = _event_buffer
+
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(_EVENT_BATCH_WINDOW)
+        while len(batch) < _EVENT_BATCH_MAX:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        try:
+            client = get_http_client()
+            # orjson straight to bytes; Content-Type comes from the constant
+            # headers, so httpx's json= path (stdlib dumps + re-encode) is skipped
+            response = await client.post(
+                f"{INNGEST_BASE_URL}/v1/events",
+                content=orjson.dumps([payload for payload, _ in batch]),
+                headers=_INNGEST_HEADERS,
+                timeout=10.0
+            )
+            ok = response.status_code == 200
+            if not ok:
+                logger.error("❌ Inngest batch of %d failed: %s - %s", len(batch), response.status_code, response.text)
+        except Exception as e:
+            logger.error("❌ Inngest batch post failed: %s", e)
+            ok = False
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(ok)
+
+
+async def stop_event_batcher() -> None:
+    """Flush buffered Inngest events, then cancel the batcher task
+
+    Called from app lifespan shutdown, mirroring stop_status_refresher:
+    events sitting in the coalescing window get a bounded chance to go out
+    instead of being silently dropped with an orphaned task.
+    """
+    global _event_batcher_task, _event_buffer
+    task, _event_batcher_task = _event_batcher_task, None
+    buffer, _event_buffer = _event_buffer, None
+    if task is None:
+        return
+
+    if buffer is not None and not buffer.empty():
+        # Wait for the batcher to pick up what's queued, plus one extra
+        # window so the POST it builds can get onto the wire
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _EVENT_BATCH_WINDOW + 5.0
+        while not buffer.empty() and loop.time() < deadline:
+            await asyncio.sleep(_EVENT_BATCH_WINDOW)
+        await asyncio.sleep(_EVENT_BATCH_WINDOW)
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _send_inngest_event(event_payload: Dict[str, Any]) -> bool:
+    """Queue an event for the batcher and await its delivery outcome"""
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _get_event_buffer().put_nowait((event_payload, future))
+    return await future
+
+
 async def trigger_inngest_job(analysis_id: str, request: AnalysisRequest) -> bool:
     """Trigger Inngest wildfire analysis job"""
     try:
@@ -143,35 +528,31 @@ async def trigger_inngest_job(analysis_id: str, request: AnalysisRequest) -> boo
             }
         }
         
-        headers = {
-            "Authorization": f"Bearer {INNGEST_EVENT_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{INNGEST_BASE_URL}/v1/events",
-                json=event_payload,
-                headers=headers,
-                timeout=10.0
-            )
-            
-            if response.status_code == 200:
-                logger.info(f"✅ Inngest job triggered for analysis {analysis_id}")
-                return True
-            else:
-                logger.error(f"❌ Inngest job failed: {response.status_code} - {response.text}")
-                # Fallback to direct analysis
-                await run_comprehensive_analysis_pipeline(analysis_id, request)
-                return True
+        if await _send_inngest_event(event_payload):
+            logger.info("✅ Inngest job triggered for analysis %s", analysis_id)
+            return True
+        else:
+            # Batcher already logged the failure details
+            logger.error("❌ Inngest job failed for analysis %s", analysis_id)
+            # Fallback to direct analysis
+            await run_comprehensive_analysis_pipeline(analysis_id, request)
+            return True
     
     except Exception as e:
-        logger.error(f"Failed to trigger Inngest job: {str(e)}")
+        logger.error("Failed to trigger Inngest job: %s", e)
         # Fallback to direct analysis
         await run_comprehensive_analysis_pipeline(analysis_id, request)
         return True
 
 
+def _fallback_ticket_url(analysis_id: str) -> str:
+    """Simulated Jira ticket URL when Make.com cannot supply a real one.
+
+    The analysis ID is already a random UUID, so its leading hex chars are
+    as good an identifier as a salted hash of the whole string."""
+    return f"https://nalamaui30.atlassian.net/browse/PYRO-{analysis_id[:3].upper()}"
+
+
 async def run_comprehensive_analysis_pipeline(analysis_id: str, request: AnalysisRequest):
     """
     Run comprehensive 7-phase analysis pipeline with real sponsor tool integrations
@@ -184,85 +565,124 @@ async def run_comprehensive_analysis_pipeline(analysis_id: str, request: Analysi
     Phase 6: Incident automation (Make.com webhook → Jira)
     Phase 7: Complete
     """
-    start_time = datetime.now()
-    
+    # Monotonic clock for elapsed-time math; wall-clock datetimes are only
+    # built where a timestamp is actually serialized to the client
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    result = await analysis_store.get(analysis_id)
+    if result is None:
+        logger.error("❌ Analysis %s missing from store, aborting pipeline", analysis_id)
+        return
+
     try:
-        # Phase timings based on demo mode
-        if request.demo_mode:
-            phase_delays = [0.2, 0.8, 0.5, 0.4, 0.6, 1.0, 0.3]  # Faster for demo
-        else:
-            phase_delays = [0.5, 2.5, 1.5, 1.0, 1.5, 3.0, 0.5]  # Realistic timing
-        
-        await asyncio.sleep(phase_delays[0])
-        
+        # Cosmetic pacing only for demo mode; real analyses run unthrottled
+        async def pace(i: int) -> None:
+            if request.demo_mode:
+                await asyncio.sleep(_DEMO_DELAYS[i])
+
+        await pace(0)
+
         # Phase 1: Location verification (already completed)
-        logger.info(f"🗺️ Phase 1: Location verified for {request.latitude}, {request.longitude}")
-        
-        await asyncio.sleep(phase_delays[1])
-        
-        # Phase 2: Advanced satellite image analysis with Clarifai + Anthropic
+        logger.info("🗺️ Phase 1: Location verified for %s, %s", request.latitude, request.longitude)
+
+        # Phases 2-4 are independent external calls (satellite, NOAA weather,
+        # Overpass power lines) - run them concurrently so total wall time is
+        # the slowest integration, not the sum of all three
         logger.info("🛰️ Phase 2: Starting satellite image analysis...")
-        satellite_result = await analyze_satellite_imagery(request.latitude, request.longitude, request.demo_mode)
-        
-        if satellite_result:
-            analysis_results[analysis_id].satellite = type('obj', (object,), satellite_result)()
-            logger.info(f"🛰️ Phase 2: Satellite analysis complete - dryness {satellite_result['dryness_score']:.2f}")
-        else:
-            # Fallback to demo data
-            satellite_result = {
-                "dryness_score": 0.68,
-                "confidence": 0.75,
-                "tile_date": datetime.now().strftime("%Y-%m-%d"),
-                "analysis_method": "fallback_demo"
-            }
-            analysis_results[analysis_id].satellite = type('obj', (object,), satellite_result)()
-            logger.warning("🛰️ Phase 2: Using fallback satellite data")
-        
-        await asyncio.sleep(phase_delays[2])
-        
-        # Phase 3: Enhanced NOAA weather data integration
         logger.info("🌤️ Phase 3: Fetching NOAA weather data...")
-        weather_data = await get_weather_data(request.latitude, request.longitude, request.demo_mode)
-        
-        if weather_data:
-            weather_result = {
-                "wind_speed_mph": weather_data["wind_speed_mph"],
-                "humidity_percent": weather_data["humidity_percent"], 
-                "temperature_f": weather_data["temperature_f"],
-                "conditions": weather_data["conditions"],
-                "wind_direction": weather_data.get("wind_direction", "unknown"),
-                "pressure_mb": weather_data.get("pressure_mb", 1013.0),
-                "station_id": weather_data.get("station_id", "unknown"),
-                "source": weather_data.get("source", "noaa")
-            }
-            analysis_results[analysis_id].weather = type('obj', (object,), weather_result)()
-            logger.info(f"🌤️ Phase 3: Weather data complete - {weather_result['temperature_f']}°F, {weather_result['wind_speed_mph']} mph wind, {weather_result['humidity_percent']}% humidity")
-        else:
-            logger.warning("🌤️ Phase 3: Weather data unavailable, using defaults")
-            weather_result = {"temperature_f": 75.0, "humidity_percent": 65.0, "wind_speed_mph": 10.0, "conditions": "unknown"}
-            analysis_results[analysis_id].weather = type('obj', (object,), weather_result)()
-        
-        await asyncio.sleep(phase_delays[3])
-        
-        # Phase 4: Power line infrastructure analysis
         logger.info("⚡ Phase 4: Analyzing power infrastructure...")
-        power_data = get_power_line_data(request.latitude, request.longitude, request.demo_mode)
-        if not power_data:
-            power_data = create_demo_power_data(request.latitude, request.longitude)
-        
-        power_result = {
-            "count": power_data["count"],
-            "nearest_distance_m": power_data["nearest_distance_m"],
-            "transmission_towers": power_data.get("transmission_towers", 0)
+
+        # Handle each phase the moment its task resolves, so SSE clients see
+        # the fast integrations land immediately instead of waiting for the
+        # slowest of the three
+        phase_tasks = {
+            asyncio.create_task(_cached_satellite_analysis(request.latitude, request.longitude, request.demo_mode)): "satellite",
+            asyncio.create_task(_cached_weather_data(request.latitude, request.longitude, request.demo_mode)): "weather",
+            asyncio.create_task(_cached_power_line_data(request.latitude, request.longitude, request.demo_mode)): "power",
         }
-        analysis_results[analysis_id].power_lines = type('obj', (object,), power_result)()
-        logger.info(f"⚡ Phase 4: Power infrastructure analysis complete - {power_result['count']} lines, nearest {power_result['nearest_distance_m']:.0f}m")
-        
-        await asyncio.sleep(phase_delays[4])
+
+        satellite_result = weather_result = power_result = None
+        # Demo pacing indices for phases 2-4: each phase pauses before its
+        # publish so the demo UI animates them landing in sequence instead
+        # of all three resolving in the same instant
+        demo_delay_index = {"satellite": 1, "weather": 2, "power": 3}
+        pending = set(phase_tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # asyncio.wait returns a set; sort same-batch resolutions into
+            # phase order so the demo stagger always plays satellite,
+            # weather, power with its matching delay
+            for task in sorted(done, key=lambda t: demo_delay_index[phase_tasks[t]]):
+                phase = phase_tasks[task]
+                try:
+                    value = task.result()
+                except Exception as e:
+                    # Fall back per-phase on failure, same as the
+                    # sequential paths did
+                    logger.error("❌ %s fetch raised: %s", phase, e)
+                    value = None
+
+                if phase == "satellite":
+                    # Phase 2: satellite image analysis (Clarifai + Anthropic)
+                    if value:
+                        satellite_result = value
+                        logger.info("🛰️ Phase 2: Satellite analysis complete - dryness %.2f", value["dryness_score"])
+                    else:
+                        satellite_result = {
+                            "dryness_score": 0.68,
+                            "confidence": 0.75,
+                            "tile_date": datetime.now().strftime("%Y-%m-%d"),
+                            "analysis_method": "fallback_demo"
+                        }
+                        logger.warning("🛰️ Phase 2: Using fallback satellite data")
+                    result.satellite = SatelliteData(**satellite_result)
+                    result.phases_done |= P_SATELLITE
+
+                elif phase == "weather":
+                    # Phase 3: NOAA weather data integration
+                    if value:
+                        weather_result = {
+                            "wind_speed_mph": value["wind_speed_mph"],
+                            "humidity_percent": value["humidity_percent"],
+                            "temperature_f": value["temperature_f"],
+                            "conditions": value["conditions"],
+                            "wind_direction": value.get("wind_direction", "unknown"),
+                            "pressure_mb": value.get("pressure_mb", 1013.0),
+                            "station_id": value.get("station_id", "unknown"),
+                            "source": value.get("source", "noaa")
+                        }
+                        logger.info("🌤️ Phase 3: Weather data complete - %s°F, %s mph wind, %s%% humidity", weather_result["temperature_f"], weather_result["wind_speed_mph"], weather_result["humidity_percent"])
+                    else:
+                        logger.warning("🌤️ Phase 3: Weather data unavailable, using defaults")
+                        weather_result = {"temperature_f": 75.0, "humidity_percent": 65.0, "wind_speed_mph": 10.0, "conditions": "unknown"}
+                    result.weather = WeatherData(**weather_result)
+                    result.phases_done |= P_WEATHER
+
+                else:
+                    # Phase 4: power line infrastructure analysis
+                    if not value:
+                        value = create_demo_power_data(request.latitude, request.longitude)
+                    power_result = {
+                        "count": value["count"],
+                        "nearest_distance_m": value["nearest_distance_m"],
+                        "transmission_towers": value.get("transmission_towers", 0)
+                    }
+                    result.power_lines = PowerLineData(**power_result)
+                    result.phases_done |= P_POWER
+                    logger.info("⚡ Phase 4: Power infrastructure analysis complete - %d lines, nearest %.0fm", power_result["count"], power_result["nearest_distance_m"])
+
+                await pace(demo_delay_index[phase])
+                await _persist_and_publish(analysis_id, result)
+
+        await pace(4)
         
         # Phase 5: Advanced AI risk assessment reasoning across all data
         logger.info("🧠 Phase 5: AI risk assessment reasoning...")
-        risk_assessment = perform_comprehensive_risk_assessment(
+        # Pure-CPU step: push it off the event loop so concurrent analyses'
+        # I/O callbacks keep progressing while the rationale is built
+        risk_assessment = await asyncio.to_thread(
+            perform_comprehensive_risk_assessment,
             satellite_result,
             weather_result,
             power_result,
@@ -270,57 +690,162 @@ async def run_comprehensive_analysis_pipeline(analysis_id: str, request: Analysi
             request.longitude
         )
         
-        analysis_results[analysis_id].risk_assessment = type('obj', (object,), risk_assessment)()
-        logger.info(f"🧠 Phase 5: Risk assessment complete - {risk_assessment['severity']} risk ({risk_assessment['risk_level']:.2f})")
+        result.risk_assessment = RiskAssessment(**risk_assessment)
+        result.phases_done |= P_RISK
+        await _persist_and_publish(analysis_id, result)
+        logger.info("🧠 Phase 5: Risk assessment complete - %s risk (%.2f)", risk_assessment["severity"], risk_assessment["risk_level"])
         
-        await asyncio.sleep(phase_delays[5])
+        await pace(5)
         
         # Phase 6: Automated incident response via Make.com webhook
         logger.info("🎫 Phase 6: Triggering incident automation...")
+        ticket_task: Optional[asyncio.Task] = None
         if risk_assessment['risk_level'] >= 0.3:  # Only create tickets for medium+ risk
-            try:
-                # Prepare complete analysis data for Make.com webhook
-                complete_analysis_data = {
-                    "analysis_id": analysis_id,
-                    "request": request,
-                    "satellite": analysis_results[analysis_id].satellite,
-                    "weather": analysis_results[analysis_id].weather,
-                    "power_lines": analysis_results[analysis_id].power_lines,
-                    "risk_assessment": analysis_results[analysis_id].risk_assessment,
-                    "processing_time_seconds": (datetime.now() - start_time).total_seconds()
-                }
-                
-                # Send to Make.com webhook for Jira ticket creation
-                ticket_url = await send_wildfire_analysis_to_make(complete_analysis_data)
-                if ticket_url:
-                    analysis_results[analysis_id].jira_ticket_url = ticket_url
-                    logger.info(f"🎫 Phase 6: Jira ticket created via Make.com - {ticket_url}")
-                else:
-                    # Fallback to simulated ticket
-                    ticket_url = f"https://nalamaui30.atlassian.net/browse/PYRO-{abs(hash(analysis_id)) % 1000:03d}"
-                    analysis_results[analysis_id].jira_ticket_url = ticket_url
-                    logger.warning(f"🎫 Phase 6: Using fallback ticket URL - {ticket_url}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Phase 6: Incident automation failed: {str(e)}")
-                # Create fallback ticket URL
-                ticket_url = f"https://nalamaui30.atlassian.net/browse/PYRO-{abs(hash(analysis_id)) % 1000:03d}"
-                analysis_results[analysis_id].jira_ticket_url = ticket_url
+            # Prepare complete analysis data for Make.com webhook
+            # Pass the raw phase dicts straight through - no model or
+            # wrapper round-trip just for the webhook to unpack again
+            complete_analysis_data = {
+                "analysis_id": analysis_id,
+                "request": request.model_dump(),
+                "satellite": satellite_result,
+                "weather": weather_result,
+                "power_lines": power_result,
+                "risk_assessment": risk_assessment,
+                "processing_time_seconds": loop.time() - start_time
+            }
+
+            if request.demo_mode:
+                # Demo keeps the ticket on the phase timeline so the UI can
+                # show it land before the completion event
+                await _create_incident_ticket(analysis_id, complete_analysis_data)
+            else:
+                # Start the Make.com round-trip now so it overlaps the rest
+                # of phase 6/7 work; phase 7 grants it a short grace window
+                # before the terminal frame, because that frame closes every
+                # progress stream and the UI never re-reads /result
+                ticket_task = _spawn(
+                    _create_incident_ticket(analysis_id, complete_analysis_data)
+                )
         else:
             logger.info("ℹ️ Phase 6: Risk below threshold, no incident ticket needed")
         
-        await asyncio.sleep(phase_delays[6])
-        
+        await pace(6)
+
+        # Give the concurrent ticket a grace window before the terminal
+        # frame; if Make.com is slower than that, complete anyway - the
+        # shield keeps the task running and the ticket settles into the
+        # store for /result readers
+        if ticket_task is not None:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(ticket_task), timeout=_TICKET_COMPLETE_GRACE
+                )
+            except asyncio.TimeoutError:
+                logger.warning("🎫 Phase 6: Ticket still pending after %.0fs grace, completing without it", _TICKET_COMPLETE_GRACE)
+
         # Phase 7: Complete
-        analysis_results[analysis_id].status = "completed"
-        processing_time = (datetime.now() - start_time).total_seconds()
-        analysis_results[analysis_id].processing_time_seconds = processing_time
-        logger.info(f"✅ Analysis {analysis_id} completed in {processing_time:.1f}s")
-        
+        result.status = "completed"
+        processing_time = loop.time() - start_time
+        result.processing_time_seconds = processing_time
+        result.completed_at = datetime.now(timezone.utc).isoformat()
+        await _persist_and_publish(analysis_id, result)
+        _publish_complete(analysis_id, result.status)
+        logger.info("✅ Analysis %s completed in %.1fs", analysis_id, processing_time)
+
     except Exception as e:
-        logger.error(f"❌ Analysis pipeline failed for {analysis_id}: {str(e)}")
-        analysis_results[analysis_id].status = "failed"
-        analysis_results[analysis_id].error_message = str(e)
+        logger.error("❌ Analysis pipeline failed for %s: %s", analysis_id, e)
+        result.status = "failed"
+        result.error_message = str(e)
+        await analysis_store.set(analysis_id, result)
+        _publish_complete(analysis_id, result.status)
+
+
+async def _create_incident_ticket(analysis_id: str, complete_analysis_data: Dict[str, Any]) -> None:
+    """Send the Make.com webhook and record the resulting Jira ticket
+
+    Falls back to a simulated ticket URL on failure, then writes the result
+    through the store and publishes it to any live progress stream.
+    """
+    result = await analysis_store.get(analysis_id)
+    if result is None:
+        return
+
+    try:
+        ticket_url = await send_wildfire_analysis_to_make(complete_analysis_data)
+        if ticket_url:
+            logger.info("🎫 Phase 6: Jira ticket created via Make.com - %s", ticket_url)
+        else:
+            ticket_url = _fallback_ticket_url(analysis_id)
+            logger.warning("🎫 Phase 6: Using fallback ticket URL - %s", ticket_url)
+    except Exception as e:
+        logger.error("❌ Phase 6: Incident automation failed: %s", e)
+        ticket_url = _fallback_ticket_url(analysis_id)
+
+    result.jira_ticket_url = ticket_url
+    result.phases_done |= P_TICKET
+    await _persist_and_publish(analysis_id, result)
+
+
+async def _cached_satellite_analysis(latitude: float, longitude: float, demo_mode: bool) -> Optional[Dict[str, Any]]:
+    """Parent-tile-cached wrapper around analyze_satellite_imagery
+
+    Quantizes the coordinates up to the parent tile before the cache lookup
+    and the analysis itself, so every sub-request inside the same ~2 km tile
+    is served by the first analysis that covered it.
+
+    Demo runs bypass the cache entirely: their canned results must not be
+    served to later production analyses of the same tile, and demo data is
+    instant anyway.
+    """
+    plat = round(latitude / SATELLITE_PARENT_STEP) * SATELLITE_PARENT_STEP
+    plon = round(longitude / SATELLITE_PARENT_STEP) * SATELLITE_PARENT_STEP
+
+    if demo_mode:
+        return await analyze_satellite_imagery(plat, plon, True)
+
+    cached = await tile_cache.get("satellite", plat, plon)
+    if cached is not None:
+        logger.info("🛰️ Satellite analysis served from tile cache (%d hits / %d misses)", tile_cache.hits, tile_cache.misses)
+        return cached
+
+    fresh = await analyze_satellite_imagery(plat, plon, demo_mode)
+    if fresh:
+        await tile_cache.set("satellite", plat, plon, fresh, ttl=SATELLITE_CACHE_TTL)
+    return fresh
+
+
+async def _cached_weather_data(latitude: float, longitude: float, demo_mode: bool) -> Optional[Dict[str, Any]]:
+    """Tile-cached wrapper around get_weather_data; demo runs skip the cache
+    so canned values never masquerade as live observations"""
+    if demo_mode:
+        return await get_weather_data(latitude, longitude, True)
+
+    cached = await tile_cache.get("weather", latitude, longitude)
+    if cached is not None:
+        logger.info("🌤️ Weather data served from tile cache (%d hits / %d misses)", tile_cache.hits, tile_cache.misses)
+        return cached
+
+    fresh = await get_weather_data(latitude, longitude, demo_mode)
+    if fresh:
+        await tile_cache.set("weather", latitude, longitude, fresh, ttl=WEATHER_CACHE_TTL)
+    return fresh
+
+
+async def _cached_power_line_data(latitude: float, longitude: float, demo_mode: bool) -> Optional[Dict[str, Any]]:
+    """Tile-cached wrapper around the sync get_power_line_data; demo runs
+    skip the cache so canned values never reach production analyses"""
+    if demo_mode:
+        return await asyncio.to_thread(get_power_line_data, latitude, longitude, True)
+
+    cached = await tile_cache.get("power", latitude, longitude)
+    if cached is not None:
+        logger.info("⚡ Power line data served from tile cache (%d hits / %d misses)", tile_cache.hits, tile_cache.misses)
+        return cached
+
+    fresh = await asyncio.to_thread(get_power_line_data, latitude, longitude, demo_mode)
+    if fresh:
+        await tile_cache.set("power", latitude, longitude, fresh, ttl=POWER_CACHE_TTL)
+    return fresh
 
 
 async def analyze_satellite_imagery(latitude: float, longitude: float, demo_mode: bool) -> Optional[Dict[str, Any]]:
@@ -336,7 +861,7 @@ async def analyze_satellite_imagery(latitude: float, longitude: float, demo_mode
         image_data = get_satellite_image_bytes(latitude, longitude)
         
         if image_data:
-            logger.info(f"📡 Got {len(image_data)} bytes of satellite imagery")
+            logger.info("📡 Got %d bytes of satellite imagery", len(image_data))
             # Analyze with enhanced Clarifai analysis
             return await analyze_with_clarifai(image_data, {"latitude": latitude, "longitude": longitude}, demo_mode=False)
         else:
@@ -344,7 +869,7 @@ async def analyze_satellite_imagery(latitude: float, longitude: float, demo_mode
             return await analyze_with_clarifai(None, {"latitude": latitude, "longitude": longitude}, demo_mode=True)
             
     except Exception as e:
-        logger.error(f"❌ Satellite imagery analysis failed: {str(e)}")
+        logger.error("❌ Satellite imagery analysis failed: %s", e)
         return None
 
 
@@ -359,6 +884,10 @@ def perform_comprehensive_risk_assessment(
     Comprehensive AI risk assessment reasoning across all environmental data
     
     This function acts as the MCP agent, reasoning across multiple data sources to predict wildfire risk
+
+    Deliberately synchronous pure-CPU code: the pipeline invokes it through
+    asyncio.to_thread so the float math and rationale building never stall
+    the event loop under concurrent load.
     """
     
     # Extract key risk factors
@@ -374,69 +903,41 @@ def perform_comprehensive_risk_assessment(
     power_count = power_lines.get("count", 0)
     nearest_power_m = power_lines.get("nearest_distance_m", 1000.0)
     
-    # Comprehensive risk calculation with reasoning
-    risk_factors = []
-    risk_score = 0.0
-    
+    # Branchless numeric core: each component is clamped arithmetic over the
+    # extracted floats, no intermediate accumulators or conditionals. The
+    # max/min clamps map 1:1 onto np.clip, so if a grid/batch scorer is ever
+    # needed this block lifts to array inputs without restructuring
     # 1. Vegetation dryness analysis (40% of risk)
     vegetation_risk = dryness_score * 0.4
-    risk_score += vegetation_risk
-    
-    if dryness_score > 0.8:
-        risk_factors.append("critically dry vegetation")
-    elif dryness_score > 0.6:
-        risk_factors.append("moderately dry vegetation")
-    elif dryness_score > 0.4:
-        risk_factors.append("slightly dry vegetation")
-    
-    # 2. Weather conditions analysis (35% of risk)
-    weather_risk = 0.0
-    
-    # Temperature factor
-    temp_factor = max(0, (temperature_f - 70) / 40.0)  # Risk increases above 70°F
-    weather_risk += temp_factor * 0.15
-    
-    # Humidity factor (inverse relationship)
-    humidity_factor = max(0, (80 - humidity_percent) / 80.0)  # Risk increases below 80%
-    weather_risk += humidity_factor * 0.10
-    
-    # Wind factor  
-    wind_factor = min(1.0, wind_speed_mph / 30.0)  # Risk increases with wind
-    weather_risk += wind_factor * 0.10
-    
-    risk_score += weather_risk
-    
-    # Weather-based risk factors
-    if temperature_f > 85:
-        risk_factors.append("high temperature")
-    if humidity_percent < 40:
-        risk_factors.append("low humidity")
-    if wind_speed_mph > 20:
-        risk_factors.append("strong winds")
-    if "dry" in conditions.lower() or "clear" in conditions.lower():
-        risk_factors.append("dry weather conditions")
-    
-    # 3. Power infrastructure risk (25% of risk)
-    power_risk = 0.0
-    if power_count > 0:
-        # Proximity risk
-        proximity_factor = max(0, (500 - nearest_power_m) / 500.0)
-        # Density risk
-        density_factor = min(1.0, power_count / 10.0)
-        power_risk = (proximity_factor + density_factor) / 2.0 * 0.25
-        
-        if nearest_power_m < 100:
-            risk_factors.append("very close power lines")
-        elif nearest_power_m < 300:
-            risk_factors.append("nearby power infrastructure")
-        
-        if power_count > 5:
-            risk_factors.append("dense power line network")
-    
-    risk_score += power_risk
-    
-    # Ensure risk score is between 0 and 1
-    risk_score = max(0, min(1, risk_score))
+
+    # 2. Weather conditions analysis (35% of risk): temperature above 70°F,
+    # humidity below 80%, wind up to 30 mph
+    weather_risk = (
+        max(0.0, (temperature_f - 70) / 40.0) * 0.15
+        + max(0.0, (80 - humidity_percent) / 80.0) * 0.10
+        + min(1.0, wind_speed_mph / 30.0) * 0.10
+    )
+
+    # 3. Power infrastructure risk (25% of risk): proximity + density,
+    # zeroed out when no lines are in range
+    power_risk = (power_count > 0) * (
+        max(0.0, (500 - nearest_power_m) / 500.0)
+        + min(1.0, power_count / 10.0)
+    ) / 2.0 * 0.25
+
+    risk_score = max(0, min(1, vegetation_risk + weather_risk + power_risk))
+
+    # Single pass over the precomputed threshold table
+    factor_inputs = {
+        "dryness": dryness_score,
+        "temperature_f": temperature_f,
+        "humidity_percent": humidity_percent,
+        "wind_speed_mph": wind_speed_mph,
+        "conditions": conditions.lower(),
+        "power_count": power_count,
+        "nearest_power_m": nearest_power_m,
+    }
+    risk_factors = [label for predicate, label in _RISK_FACTOR_RULES if predicate(factor_inputs)]
     
     # Determine severity based on risk score
     if risk_score >= 0.8:
@@ -452,33 +953,36 @@ def perform_comprehensive_risk_assessment(
         severity = "LOW"
         severity_desc = "minimal concern"
     
-    # Generate comprehensive rationale using MCP agent reasoning
+    # Generate comprehensive rationale using MCP agent reasoning; fragments
+    # are joined once at the end instead of repeated str concatenation
     if risk_factors:
         risk_factor_text = ", ".join(risk_factors)
-        rationale = f"Wildfire risk assessment indicates {severity.lower()} danger due to {risk_factor_text}. "
+        fragments = [f"Wildfire risk assessment indicates {severity.lower()} danger due to {risk_factor_text}. "]
     else:
-        rationale = f"Wildfire risk assessment shows {severity.lower()} danger with standard environmental conditions. "
-    
+        fragments = [f"Wildfire risk assessment shows {severity.lower()} danger with standard environmental conditions. "]
+
     # Add specific reasoning based on dominant factors
     if vegetation_risk > 0.3:
-        rationale += f"Satellite imagery shows {dryness_score:.0%} vegetation dryness (analyzed via {analysis_method}). "
-    
+        fragments.append(f"Satellite imagery shows {dryness_score:.0%} vegetation dryness (analyzed via {analysis_method}). ")
+
     if weather_risk > 0.2:
-        rationale += f"Weather conditions contribute to fire risk with {temperature_f}°F temperature, {humidity_percent}% humidity, and {wind_speed_mph} mph winds. "
-        
+        fragments.append(f"Weather conditions contribute to fire risk with {temperature_f}°F temperature, {humidity_percent}% humidity, and {wind_speed_mph} mph winds. ")
+
     if power_risk > 0.1:
-        rationale += f"Power infrastructure poses ignition risk with {power_count} lines within 500m, nearest at {nearest_power_m:.0f}m. "
-    
+        fragments.append(f"Power infrastructure poses ignition risk with {power_count} lines within 500m, nearest at {nearest_power_m:.0f}m. ")
+
     # Add location-specific context for Hawaiian Islands
-    rationale += f"Analysis performed for Hawaiian Islands location {latitude:.4f}°N, {abs(longitude):.4f}°W. "
-    
+    fragments.append(f"Analysis performed for Hawaiian Islands location {latitude:.4f}°N, {abs(longitude):.4f}°W. ")
+
     # Add actionable recommendations
     if risk_score >= 0.6:
-        rationale += "Recommend increased monitoring and fire prevention measures."
+        fragments.append("Recommend increased monitoring and fire prevention measures.")
     elif risk_score >= 0.3:
-        rationale += "Standard fire safety protocols advised."
+        fragments.append("Standard fire safety protocols advised.")
     else:
-        rationale += "Current conditions pose minimal fire risk."
+        fragments.append("Current conditions pose minimal fire risk.")
+
+    rationale = "".join(fragments)
     
     return {
         "risk_level": float(risk_score),
@@ -508,7 +1012,8 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
     """
     try:
         # Validate coordinates are in Hawaii
-        if not is_in_hawaii(request.latitude, request.longitude):
+        if not (_HI_MIN_LAT <= request.latitude <= _HI_MAX_LAT
+                and _HI_MIN_LON <= request.longitude <= _HI_MAX_LON):
             raise HTTPException(
                 status_code=400,
                 detail={
@@ -533,15 +1038,16 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
             status="processing"
         )
         
-        # Store in memory (use Redis in production)
-        analysis_results[analysis_id] = analysis_result
+        # Persist so any worker replica can serve progress/result lookups
+        await analysis_store.set(analysis_id, analysis_result)
         
         # Trigger analysis pipeline with real sponsor integrations
         job_triggered = await trigger_inngest_job(analysis_id, request)
         
         if not job_triggered:
-            analysis_results[analysis_id].status = "failed"
-            analysis_results[analysis_id].error_message = "Failed to queue analysis job"
+            analysis_result.status = "failed"
+            analysis_result.error_message = "Failed to queue analysis job"
+            await analysis_store.set(analysis_id, analysis_result)
             
             raise HTTPException(
                 status_code=503,
@@ -551,7 +1057,7 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
                 }
             )
         
-        logger.info(f"🚀 Analysis {analysis_id} started for {request.latitude}, {request.longitude} (demo: {request.demo_mode})")
+        logger.info("🚀 Analysis %s started for %s, %s (demo: %s)", analysis_id, request.latitude, request.longitude, request.demo_mode)
         
         return {
             "analysis_id": analysis_id,
@@ -564,27 +1070,14 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
             "estimated_completion_seconds": 4 if request.demo_mode else 12,
             "progress_url": f"/api/v1/analyze/{analysis_id}/progress",
             "result_url": f"/api/v1/analyze/{analysis_id}/result",
-            "sponsor_integrations": {
-                "satellite_analysis": "Clarifai + Anthropic Vision API",
-                "weather_data": "NOAA Weather Service",
-                "power_infrastructure": "OpenStreetMap Overpass API",
-                "incident_automation": "Make.com → Jira"
-            },
-            "phases": [
-                "Location Verification",
-                "Satellite Image Analysis (Clarifai/Anthropic)", 
-                "Weather Data Integration (NOAA)",
-                "Power Infrastructure Analysis (OpenStreetMap)",
-                "AI Risk Assessment (MCP Agent Reasoning)",
-                "Incident Automation (Make.com → Jira)",
-                "Complete"
-            ]
+            "sponsor_integrations": SPONSOR_INTEGRATIONS,
+            "phases": ANALYSIS_PHASES
         }
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Analysis start failed: {str(e)}")
+        logger.error("Analysis start failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -597,7 +1090,8 @@ async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundT
 @router.get("/analyze/{analysis_id}/result")
 async def get_analysis_result(analysis_id: str) -> AnalysisResult:
     """Get complete analysis result by ID"""
-    if analysis_id not in analysis_results:
+    result = await analysis_store.get(analysis_id)
+    if result is None:
         raise HTTPException(
             status_code=404,
             detail={
@@ -605,14 +1099,18 @@ async def get_analysis_result(analysis_id: str) -> AnalysisResult:
                 "message": f"Analysis {analysis_id} not found"
             }
         )
-    
-    return analysis_results[analysis_id]
+
+    return result
 
 
 @router.get("/analyze/{analysis_id}/progress")
 async def get_analysis_progress(analysis_id: str):
     """Stream analysis progress updates via Server-Sent Events"""
-    if analysis_id not in analysis_results:
+    # Existence check only - the catch-up snapshot is re-read inside the
+    # generator after its queue is registered, so no event can fall into
+    # the gap between this lookup and the registration
+    snapshot = await analysis_store.get(analysis_id)
+    if snapshot is None:
         raise HTTPException(
             status_code=404,
             detail={
@@ -623,272 +1121,531 @@ async def get_analysis_progress(analysis_id: str):
     
     async def generate_progress_updates():
         """Generate Server-Sent Events for progress updates"""
+        # Each subscriber gets its own queue; joining never disturbs other
+        # clients already streaming the same analysis
+        queue: asyncio.Queue = asyncio.Queue()
+        progress_queues.setdefault(analysis_id, set()).add(queue)
+
+        # With Redis configured, also relay events published by a pipeline
+        # running in another worker process into this queue
+        relay: Optional[asyncio.Task] = None
+        if analysis_store.has_redis:
+            relay = asyncio.get_running_loop().create_task(
+                _forward_remote_events(analysis_id, queue)
+            )
+
         try:
-            # Send initial connection event
+            # Take the catch-up snapshot only now that the queue is
+            # registered: anything published since the handler's existence
+            # check lands in the queue instead of being lost. Fall back to
+            # the handler's snapshot if the entry just expired
+            current = await analysis_store.get(analysis_id) or snapshot
+
+            # The connect burst (connected + catch-up + maybe complete) goes
+            # out in one flush, so stamp it once instead of per frame
+            connected_at = datetime.now().isoformat()
             connection_data = {
-                "type": "connected", 
-                "analysis_id": analysis_id, 
-                "timestamp": datetime.now().isoformat()
+                "type": "connected",
+                "analysis_id": analysis_id,
+                "timestamp": connected_at
             }
-            yield f"data: {json.dumps(connection_data)}\n\n"
-            
-            # Monitor analysis progress with enhanced details
-            max_iterations = 120  # 60 seconds at 0.5s intervals
-            iteration = 0
-            last_status = None
-            
-            while iteration < max_iterations:
-                if analysis_id in analysis_results:
-                    result = analysis_results[analysis_id]
-                    
-                    # Only send updates when status changes or new data arrives
-                    current_status = {
-                        "status": result.status,
-                        "has_weather": hasattr(result, 'weather') and result.weather is not None,
-                        "has_satellite": hasattr(result, 'satellite') and result.satellite is not None,
-                        "has_power": hasattr(result, 'power_lines') and result.power_lines is not None,
-                        "has_risk": hasattr(result, 'risk_assessment') and result.risk_assessment is not None,
-                        "has_ticket": hasattr(result, 'jira_ticket_url') and result.jira_ticket_url is not None
+            yield _sse(connection_data)
+
+            # Late subscribers catch up from the snapshot, then stream
+            # phase events as the pipeline publishes them
+            yield _sse(_progress_payload(analysis_id, current))
+
+            if current.status in ["completed", "failed"]:
+                complete_data = {
+                    "type": "complete",
+                    "status": current.status,
+                    "timestamp": connected_at
+                }
+                yield _sse(complete_data)
+                return
+
+            # Deadline math bounds the whole stream: each wait gets the
+            # smaller of the idle timeout and whatever wall time remains
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _SSE_MAX_STREAM_SECONDS
+
+            while True:
+                remaining = deadline - loop.time()
+                try:
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    payload = await asyncio.wait_for(
+                        queue.get(), timeout=min(_SSE_IDLE_TIMEOUT, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    timeout_data = {
+                        "type": "timeout",
+                        "message": "Analysis taking longer than expected",
+                        "timestamp": datetime.now().isoformat()
                     }
-                    
-                    if current_status != last_status:
-                        # Send progress update
-                        progress_data = {
-                            "type": "progress",
-                            "analysis_id": analysis_id,
-                            "status": result.status,
-                            "processing_time": result.processing_time_seconds,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
-                        # Add phase-specific data if available
-                        if hasattr(result, 'weather') and result.weather:
-                            progress_data["weather"] = {
-                                "temperature_f": result.weather.temperature_f,
-                                "humidity_percent": result.weather.humidity_percent,
-                                "wind_speed_mph": result.weather.wind_speed_mph,
-                                "conditions": result.weather.conditions
-                            }
-                        
-                        if hasattr(result, 'satellite') and result.satellite:
-                            progress_data["satellite"] = {
-                                "dryness_score": result.satellite.dryness_score,
-                                "confidence": result.satellite.confidence,
-                                "tile_date": result.satellite.tile_date
-                            }
-                        
-                        if hasattr(result, 'power_lines') and result.power_lines:
-                            progress_data["power_lines"] = {
-                                "count": result.power_lines.count,
-                                "nearest_distance_m": result.power_lines.nearest_distance_m
-                            }
-                        
-                        if hasattr(result, 'risk_assessment') and result.risk_assessment:
-                            progress_data["risk_assessment"] = {
-                                "risk_level": result.risk_assessment.risk_level,
-                                "severity": result.risk_assessment.severity,
-                                "rationale": result.risk_assessment.rationale,
-                                "confidence": result.risk_assessment.confidence
-                            }
-                        
-                        if hasattr(result, 'jira_ticket_url') and result.jira_ticket_url:
-                            progress_data["jira_ticket_url"] = result.jira_ticket_url
-                        
-                        yield f"data: {json.dumps(progress_data)}\n\n"
-                        last_status = current_status
-                    
-                    # Check if analysis is complete
-                    if result.status in ["completed", "failed"]:
-                        complete_data = {
-                            "type": "complete", 
-                            "status": result.status, 
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        yield f"data: {json.dumps(complete_data)}\n\n"
+                    yield _sse(timeout_data)
+                    break
+
+                # Progress payloads are cumulative snapshots, so if several
+                # phases landed while the last frame was in flight, only the
+                # newest backlog entry needs to go out; a terminal event in
+                # the backlog still gets its own frame
+                while payload.get("type") == "progress":
+                    try:
+                        backlog = queue.get_nowait()
+                    except asyncio.QueueEmpty:
                         break
-                
-                # Wait before next update
-                await asyncio.sleep(0.5)
-                iteration += 1
-            
-            # Send timeout if we reach max iterations
-            if iteration >= max_iterations:
-                timeout_data = {
-                    "type": "timeout", 
-                    "message": "Analysis taking longer than expected", 
-                    "timestamp": datetime.now().isoformat()
-                }
-                yield f"data: {json.dumps(timeout_data)}\n\n"
-        
+                    if backlog.get("type") != "progress":
+                        yield _sse(payload)
+                    payload = backlog
+
+                yield _sse(payload)
+
+                if payload.get("type") == "complete":
+                    break
+
         except Exception as e:
-            logger.error(f"Progress streaming error: {str(e)}")
+            logger.error("Progress streaming error: %s", e)
             error_data = {
-                "type": "error", 
-                "message": "Progress streaming failed", 
+                "type": "error",
+                "message": "Progress streaming failed",
                 "timestamp": datetime.now().isoformat()
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield _sse(error_data)
+
+        finally:
+            if relay is not None:
+                relay.cancel()
+            # Remove only this subscriber; drop the set once it's empty
+            subscribers = progress_queues.get(analysis_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    progress_queues.pop(analysis_id, None)
     
-    return StreamingResponse(
+    # EventSourceResponse tears the generator down as soon as the client
+    # drops and emits keepalive pings so proxies don't cut idle streams
+    return EventSourceResponse(
         generate_progress_updates(),
-        media_type="text/event-stream",
+        ping=15,
         headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
             "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control"
+            "Access-Control-Allow-Headers": "Cache-Control",
+            # Disable nginx buffering so events flush in real time
+            "X-Accel-Buffering": "no"
         }
     )
 
 
 @router.post("/analyze/{analysis_id}/update")
-async def update_analysis_result(analysis_id: str, update_data: Dict[str, Any]):
+async def update_analysis_result(analysis_id: str, update_data: Dict[str, Any], request: Request):
     """
     Internal endpoint for Inngest worker to update analysis progress.
     In production, this would be protected with API keys.
     """
-    if analysis_id not in analysis_results:
+    result = await analysis_store.get(analysis_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Analysis not found")
-    
-    result = analysis_results[analysis_id]
-    
-    # Update fields based on what's provided
-    if "status" in update_data:
-        result.status = update_data["status"]
-    
-    if "processing_time_seconds" in update_data:
-        result.processing_time_seconds = update_data["processing_time_seconds"]
-    
-    if "weather" in update_data:
-        from apps.shared.models.risk_inputs import WeatherData
-        result.weather = WeatherData(**update_data["weather"])
-    
-    if "satellite" in update_data:
-        from apps.shared.models.risk_inputs import SatelliteData
-        result.satellite = SatelliteData(**update_data["satellite"])
-    
-    if "power_lines" in update_data:
-        from apps.shared.models.risk_inputs import PowerLineData
-        result.power_lines = PowerLineData(**update_data["power_lines"])
-    
-    if "risk_assessment" in update_data:
-        from apps.shared.models.risk_inputs import RiskAssessment
-        result.risk_assessment = RiskAssessment(**update_data["risk_assessment"])
-    
-    if "jira_ticket_url" in update_data:
-        result.jira_ticket_url = update_data["jira_ticket_url"]
-    
-    if "error_message" in update_data:
-        result.error_message = update_data["error_message"]
-    
-    logger.info(f"📊 Analysis {analysis_id} updated: {result.status}")
-    
+
+    # The worker serializes already-validated models, so when it proves
+    # itself with the shared token the sub-results skip re-validation via
+    # model_construct; anonymous callers still pay the full validator pass
+    trusted = (
+        _INTERNAL_API_TOKEN is not None
+        and request.headers.get("x-internal-token") == _INTERNAL_API_TOKEN
+    )
+
+    # Apply whatever fields the worker sent via the module-level dispatch
+    # tables instead of a ladder of membership checks
+    for field, (model, bit) in _UPDATE_MODEL_FIELDS.items():
+        value = update_data.get(field)
+        if value is not None:
+            build = model.model_construct if trusted else model
+            setattr(result, field, build(**value))
+            result.phases_done |= bit
+
+    for field, bit in _UPDATE_SCALAR_FIELDS.items():
+        if field in update_data:
+            setattr(result, field, update_data[field])
+            result.phases_done |= bit
+
+    # Persist and feed any live progress streams - on the Inngest-worker
+    # path this endpoint is the only publisher, so skipping the queues would
+    # leave SSE subscribers staring at their connect snapshot
+    await _persist_and_publish(analysis_id, result)
+    if result.status in ("completed", "failed"):
+        _publish_complete(analysis_id, result.status)
+    logger.info("📊 Analysis %s updated: %s", analysis_id, result.status)
+
     return {"status": "updated"}
 
 
+# Demo locations are static: build the tuple once at import and keep the
+# serialized response alongside it, so the endpoint ships pre-built bytes
+_DEMO_LOCATIONS = (
+    {
+        "name": "West Maui (Lahaina)",
+        "latitude": 20.8783,
+        "longitude": -156.6825,
+        "description": "High-risk wildfire area with dry vegetation near Lahaina"
+    },
+    {
+        "name": "Central Maui",
+        "latitude": 20.8893,
+        "longitude": -156.4729,
+        "description": "Moderate risk area with mixed vegetation and infrastructure"
+    },
+    {
+        "name": "Big Island Volcano Area",
+        "latitude": 19.7633,
+        "longitude": -155.5739,
+        "description": "Active volcanic region with stressed vegetation"
+    },
+    {
+        "name": "Oahu North Shore",
+        "latitude": 21.6389,
+        "longitude": -158.0001,
+        "description": "Coastal area with moderate vegetation density"
+    },
+    {
+        "name": "Kauai Interior",
+        "latitude": 22.0964,
+        "longitude": -159.5261,
+        "description": "Dense forest area with lower fire risk potential"
+    }
+)
+_DEMO_LOCATIONS_BODY = orjson.dumps({"locations": _DEMO_LOCATIONS})
+
+
 @router.get("/demo-locations")
-async def get_demo_locations():
+async def get_demo_locations() -> Response:
     """Get predefined demo locations in Hawaii for quick testing"""
-    return {
-        "locations": [
-            {
-                "name": "West Maui (Lahaina)",
-                "latitude": 20.8783,
-                "longitude": -156.6825,
-                "description": "High-risk wildfire area with dry vegetation near Lahaina"
-            },
-            {
-                "name": "Central Maui",
-                "latitude": 20.8893,
-                "longitude": -156.4729,
-                "description": "Moderate risk area with mixed vegetation and infrastructure"
-            },
-            {
-                "name": "Big Island Volcano Area",
-                "latitude": 19.7633,
-                "longitude": -155.5739,
-                "description": "Active volcanic region with stressed vegetation"
-            },
-            {
-                "name": "Oahu North Shore",
-                "latitude": 21.6389,
-                "longitude": -158.0001,
-                "description": "Coastal area with moderate vegetation density"
-            },
-            {
-                "name": "Kauai Interior",
-                "latitude": 22.0964,
-                "longitude": -159.5261,
-                "description": "Dense forest area with lower fire risk potential"
-            }
-        ]
-    }
+    return Response(
+        content=_DEMO_LOCATIONS_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 
-@router.get("/system-status")
-async def get_system_status():
-    """Get comprehensive system status including all sponsor tool integrations"""
+async def _bounded(coro, timeout: float = _STATUS_PROBE_TIMEOUT):
+    """Bound a status probe in both time and concurrency
+
+    Excess probes queue on the semaphore instead of piling onto the upstream
+    services; the timeout covers the wait so a saturated queue still degrades
+    into a timeout entry rather than blocking the caller.
+    """
+    async def _run():
+        async with _PROBE_SEM:
+            return await coro
+    return await asyncio.wait_for(_run(), timeout=timeout)
+
+
+def _probe_result(value):
+    """Normalize a gather slot: timeouts and errors become status entries"""
+    if isinstance(value, CircuitOpenError):
+        return {"status": "error", "error": "circuit_open"}
+    if isinstance(value, asyncio.TimeoutError):
+        return {"status": "timeout", "timeout_seconds": _STATUS_PROBE_TIMEOUT}
+    if isinstance(value, Exception):
+        # repr: cheap, and avoids exception classes with expensive __str__
+        return {"status": "error", "error": repr(value)}
+    return value
+
+
+# Every probe returns a status dict, so slots zip uniformly into the payload
+_STATUS_PROBES = (
+    ("satellite_analysis", test_satellite_analysis_systems),
+    ("weather_service", test_noaa_status),
+    ("incident_automation", test_make_webhook),
+)
+
+# Per-probe circuit breakers: during a known outage callers fast-fail for a
+# cooldown instead of re-paying the probe timeout on every refresh
+_PROBE_BREAKERS = {name: AsyncCircuitBreaker(fail_max=3, reset_timeout=60.0) for name, _ in _STATUS_PROBES}
+
+
+async def _guarded_probe(name: str, probe) -> Any:
+    """Run one probe through its breaker with the timeout/semaphore bounds"""
+    return await _PROBE_BREAKERS[name].call(lambda: _bounded(probe()))
+
+
+async def _probe_system_status() -> Dict[str, Any]:
+    """Run the sponsor-integration probes and build the status payload"""
     try:
         status_checks = await asyncio.gather(
-            test_satellite_analysis_systems(),
-            test_noaa_connection(),
-            test_make_webhook(),
+            *(_guarded_probe(name, probe) for name, probe in _STATUS_PROBES),
             return_exceptions=True
         )
         
         return {
             "system": "PyroGuard Sentinel",
             "version": "1.0.0",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "sponsor_integrations": {
-                "satellite_analysis": status_checks[0] if not isinstance(status_checks[0], Exception) else {"status": "error", "error": str(status_checks[0])},
-                "weather_service": {"status": "healthy" if status_checks[1] and not isinstance(status_checks[1], Exception) else "error"},
-                "incident_automation": status_checks[2] if not isinstance(status_checks[2], Exception) else {"status": "error", "error": str(status_checks[2])}
+                name: _probe_result(result)
+                for (name, _), result in zip(_STATUS_PROBES, status_checks)
             },
             "overall_status": "operational"
         }
         
     except Exception as e:
-        logger.error(f"System status check failed: {str(e)}")
+        logger.error("System status check failed: %s", e)
         return {
             "system": "PyroGuard Sentinel", 
             "status": "degraded",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        } 
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+
+async def _refresh_status_singleflight() -> Dict[str, Any]:
+    """Run at most one probe fan-out at a time
+
+    The first caller creates a future and probes; everyone else awaits the
+    same future and wakes together with its result, so upstream probe QPS
+    is exactly one per refresh no matter how many callers race.
+    """
+    global _status_refresh_future
+    if _status_refresh_future is not None:
+        return await _status_refresh_future
+
+    future = asyncio.get_running_loop().create_future()
+    _status_refresh_future = future
+    try:
+        payload = await _probe_system_status()
+        payload["stale"] = False
+        # Serialize and classify once per refresh; requests then ship the
+        # cached bytes without touching the JSON encoder
+        was_unhealthy = _STATUS_CACHE["unhealthy"]
+        unhealthy = _status_unhealthy(payload)
+        body = orjson.dumps(payload)
+        _STATUS_CACHE["payload"] = payload
+        _STATUS_CACHE["body"] = body
+        _STATUS_CACHE["etag"] = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _STATUS_CACHE["unhealthy"] = unhealthy
+        _STATUS_CACHE["ts"] = time.monotonic()
+
+        # Fire-and-forget so slow webhook delivery never blocks a refresh
+        if _STATUS_WEBHOOK_URL and unhealthy != was_unhealthy and _STATUS_CACHE["payload"] is not None:
+            event = "degraded" if unhealthy else "recovered"
+            asyncio.get_running_loop().create_task(_post_status_webhook(event, payload))
+
+        future.set_result(payload)
+        return payload
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        _status_refresh_future = None
+
+
+async def _post_status_webhook(event: str, payload: Dict[str, Any]) -> None:
+    """Deliver a health-transition notification to the configured webhook"""
+    try:
+        client = get_http_client()
+        await client.post(
+            _STATUS_WEBHOOK_URL,
+            json={"event": event, "status": payload},
+            timeout=10.0
+        )
+        logger.info("📣 Status webhook delivered: %s", event)
+    except Exception as e:
+        logger.warning("⚠️ Status webhook delivery failed: %s", e)
+
+
+def _status_unhealthy(payload: Dict[str, Any]) -> bool:
+    """True when the probe run degraded or any integration is down"""
+    integrations = payload.get("sponsor_integrations", {})
+    return payload.get("status") == "degraded" or any(
+        isinstance(v, dict) and v.get("status") in ("error", "timeout")
+        for v in integrations.values()
+    )
+
+
+async def _status_refresher() -> None:
+    """Keep the /system-status snapshot warm independently of request traffic"""
+    while True:
+        await _refresh_status_singleflight()
+        await asyncio.sleep(_STATUS_TTL)
+
+
+def _ensure_status_refresher() -> None:
+    """Start the refresher lazily on the running loop, batcher-style"""
+    global _status_refresher_task
+    if _status_refresher_task is None or _status_refresher_task.done():
+        _status_refresher_task = asyncio.get_running_loop().create_task(_status_refresher())
+
+
+async def stop_status_refresher() -> None:
+    """Cancel the background refresher; called from app lifespan shutdown"""
+    global _status_refresher_task
+    task, _status_refresher_task = _status_refresher_task, None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+@router.get("/system-status")
+async def get_system_status(request: Request) -> Response:
+    """Get comprehensive system status including all sponsor tool integrations"""
+    _ensure_status_refresher()
+
+    if _STATUS_CACHE["payload"] is None:
+        # First request after startup: single-flight one probe fan-out; from
+        # here on the background task keeps the snapshot warm
+        await _refresh_status_singleflight()
+        x_cache = "MISS"
+    else:
+        x_cache = "HIT"
+
+    etag = _STATUS_CACHE["etag"]
+    cache_control = f"public, max-age={int(_STATUS_TTL)}, stale-while-revalidate={int(2 * _STATUS_TTL)}"
+
+    # A snapshot the refresher hasn't replaced in two intervals is served
+    # re-stamped as stale under a suffixed ETag - if the fresh body's
+    # validator kept matching, a conditional poller would 304 forever and
+    # never learn the snapshot went stale
+    stale = time.monotonic() - _STATUS_CACHE["ts"] > 2 * _STATUS_TTL
+    if stale and etag is not None:
+        etag = f'{etag[:-1]}-stale"'
+
+    # Pollers that already hold the current snapshot get an empty 304, so a
+    # 1 Hz monitor transfers the body roughly once per refresh
+    if etag is not None and request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"Cache-Control": cache_control, "ETag": etag}
+        )
+
+    # Common case: ship the bytes serialized at refresh time, skipping the
+    # per-request JSON encode entirely (the stale re-stamp is rare, so its
+    # extra serialize doesn't matter)
+    if stale:
+        body = orjson.dumps({**_STATUS_CACHE["payload"], "stale": True})
+    else:
+        body = _STATUS_CACHE["body"]
+
+    # Degraded subsystems surface as 503 so load balancers and liveness
+    # probes can react on the status code without parsing the body
+    headers = {
+        "Cache-Control": cache_control,
+        "X-Cache": x_cache
+    }
+    if etag is not None:
+        headers["ETag"] = etag
+    return Response(
+        content=body,
+        media_type="application/json",
+        status_code=503 if _STATUS_CACHE["unhealthy"] else 200,
+        headers=headers
+    )
 
 
 # ============================================================================
 # MCP (Model Context Protocol) Endpoints
 # ============================================================================
 
+def _mcp_resource_body(uri: str, payload: Dict[str, Any]) -> bytes:
+    """Serialize a complete MCP resource-read envelope (the spec wants the
+    resource content as a JSON string inside the text field)"""
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "result": {
+            "contents": [{
+                "uri": uri,
+                "mimeType": "application/json",
+                "text": orjson.dumps(payload).decode()
+            }]
+        }
+    })
+
+
+# The MCP resources are entirely static, so each envelope is serialized once
+# at import and the read endpoint is a dict lookup returning cached bytes
+_MCP_RESOURCE_CACHE: Final[Dict[str, bytes]] = {
+    uri: _mcp_resource_body(uri, payload)
+    for uri, payload in (
+        ("resource://pyroguard/hawaiian-islands", {
+            "name": "Hawaiian Islands",
+            "bounds": {
+                "north": 22.5,
+                "south": 18.5,
+                "east": -154.0,
+                "west": -161.0
+            },
+            "major_islands": ["Hawaii", "Maui", "Oahu", "Kauai", "Molokai", "Lanai"],
+            "high_risk_areas": [
+                {"name": "West Maui", "lat": 20.8783, "lon": -156.6825},
+                {"name": "Big Island Leeward", "lat": 19.7633, "lon": -155.5739}
+            ]
+        }),
+        ("resource://pyroguard/demo-locations", {"locations": _DEMO_LOCATIONS}),
+        ("resource://pyroguard/risk-assessment-framework", {
+            "risk_levels": {
+                "LOW": {"range": [0.0, 0.3], "color": "#10b981"},
+                "MEDIUM": {"range": [0.3, 0.6], "color": "#f59e0b"},
+                "HIGH": {"range": [0.6, 0.8], "color": "#f97316"},
+                "EXTREME": {"range": [0.8, 1.0], "color": "#ef4444"}
+            },
+            "factors": {
+                "vegetation_dryness": {"weight": 0.4},
+                "weather_conditions": {"weight": 0.3},
+                "power_infrastructure": {"weight": 0.2},
+                "seasonal_adjustment": {"weight": 0.1}
+            },
+            "thresholds": {
+                "jira_ticket_creation": 0.6,
+                "emergency_alert": 0.8
+            }
+        }),
+    )
+}
+
+
+# The info and list endpoints serve fixed module-level data, so their full
+# JSON-RPC envelopes are encoded once at import (same pattern as
+# /demo-locations) and each request ships the cached bytes, bypassing the
+# response-model and encoder machinery entirely
+_MCP_INFO_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "result": {
+        "serverInfo": MCP_SERVER_INFO,
+        "capabilities": MCP_CAPABILITIES
+    }
+})
+_MCP_RESOURCES_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "result": {
+        "resources": MCP_RESOURCES
+    }
+})
+_MCP_TOOLS_BODY = orjson.dumps({
+    "jsonrpc": "2.0",
+    "result": {
+        "tools": MCP_TOOLS
+    }
+})
+
+
 @router.get("/mcp/info")
-async def mcp_server_info():
+async def mcp_server_info() -> Response:
     """
     MCP server information endpoint
     Returns server capabilities and metadata according to MCP spec
     """
-    return {
-        "jsonrpc": "2.0",
-        "result": {
-            "serverInfo": MCP_SERVER_INFO,
-            "capabilities": MCP_CAPABILITIES
-        }
-    }
+    return Response(content=_MCP_INFO_BODY, media_type="application/json")
 
 
 @router.get("/mcp/resources/list")
-async def mcp_list_resources():
+async def mcp_list_resources() -> Response:
     """
     MCP resources endpoint
     Lists available resources that can be accessed by MCP clients
     """
-    return {
-        "jsonrpc": "2.0", 
-        "result": {
-            "resources": MCP_RESOURCES
-        }
-    }
+    return Response(content=_MCP_RESOURCES_BODY, media_type="application/json")
 
 
 @router.get("/mcp/resources/read")
@@ -897,121 +1654,82 @@ async def mcp_read_resource(uri: str):
     MCP resource reading endpoint
     Returns content of specified resource
     """
-    if uri == "resource://pyroguard/hawaiian-islands":
-        return {
-            "jsonrpc": "2.0",
-            "result": {
-                "contents": [{
-                    "uri": uri,
-                    "mimeType": "application/json",
-                    "text": json.dumps({
-                        "name": "Hawaiian Islands",
-                        "bounds": {
-                            "north": 22.5,
-                            "south": 18.5, 
-                            "east": -154.0,
-                            "west": -161.0
-                        },
-                        "major_islands": ["Hawaii", "Maui", "Oahu", "Kauai", "Molokai", "Lanai"],
-                        "high_risk_areas": [
-                            {"name": "West Maui", "lat": 20.8783, "lon": -156.6825},
-                            {"name": "Big Island Leeward", "lat": 19.7633, "lon": -155.5739}
-                        ]
-                    })
-                }]
-            }
-        }
-    elif uri == "resource://pyroguard/demo-locations":
-        demo_response = await get_demo_locations()
-        return {
-            "jsonrpc": "2.0",
-            "result": {
-                "contents": [{
-                    "uri": uri,
-                    "mimeType": "application/json", 
-                    "text": json.dumps(demo_response)
-                }]
-            }
-        }
-    elif uri == "resource://pyroguard/risk-assessment-framework":
-        return {
-            "jsonrpc": "2.0",
-            "result": {
-                "contents": [{
-                    "uri": uri,
-                    "mimeType": "application/json",
-                    "text": json.dumps({
-                        "risk_levels": {
-                            "LOW": {"range": [0.0, 0.3], "color": "#10b981"},
-                            "MEDIUM": {"range": [0.3, 0.6], "color": "#f59e0b"},
-                            "HIGH": {"range": [0.6, 0.8], "color": "#f97316"}, 
-                            "EXTREME": {"range": [0.8, 1.0], "color": "#ef4444"}
-                        },
-                        "factors": {
-                            "vegetation_dryness": {"weight": 0.4},
-                            "weather_conditions": {"weight": 0.3},
-                            "power_infrastructure": {"weight": 0.2},
-                            "seasonal_adjustment": {"weight": 0.1}
-                        },
-                        "thresholds": {
-                            "jira_ticket_creation": 0.6,
-                            "emergency_alert": 0.8
-                        }
-                    })
-                }]
-            }
-        }
-    else:
+    body = _MCP_RESOURCE_CACHE.get(uri)
+    if body is None:
         raise HTTPException(status_code=404, detail=f"Resource not found: {uri}")
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/mcp/tools/list")
-async def mcp_list_tools():
+async def mcp_list_tools() -> Response:
     """
     MCP tools endpoint
     Lists available tools that can be called by MCP clients
     """
-    return {
+    return Response(content=_MCP_TOOLS_BODY, media_type="application/json")
+
+
+# Tool-call constants: the bounds check compares against module-level floats
+# (the MCP surface advertises a slightly wider envelope than the analysis
+# bbox) and the rejection/capability envelopes are built once instead of as
+# fresh dict literals on every call
+_MCP_LAT_MIN, _MCP_LAT_MAX = 18.5, 22.5
+_MCP_LON_MIN, _MCP_LON_MAX = -161.0, -154.0
+_MCP_OUT_OF_BOUNDS: Final = {
+    "jsonrpc": "2.0",
+    "error": {
+        "code": -32602,
+        "message": "Location outside Hawaiian Islands bounds"
+    }
+}
+_MCP_CAPABILITY_RESPONSES: Final = {
+    tool: {
         "jsonrpc": "2.0",
         "result": {
-            "tools": MCP_TOOLS
+            "content": [{
+                "type": "text",
+                "text": f"{label} capability available via full wildfire analysis"
+            }]
         }
     }
+    for tool, label in (
+        ("get_satellite_analysis", "Satellite analysis"),
+        ("get_weather_conditions", "Weather analysis"),
+        ("get_power_infrastructure", "Power infrastructure analysis"),
+    )
+}
 
 
 @router.post("/mcp/tools/call")
-async def mcp_call_tool(request: dict):
+async def mcp_call_tool(request: dict, background_tasks: BackgroundTasks):
     """
     MCP tool calling endpoint
     Executes specified tool with provided arguments
     """
-    tool_name = request.get("params", {}).get("name")
-    arguments = request.get("params", {}).get("arguments", {})
-    
+    params = request.get("params", {})
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+
     try:
         if tool_name == "analyze_wildfire_risk":
             # Validate Hawaiian Islands bounds
             lat = arguments["latitude"]
             lon = arguments["longitude"]
-            
-            if not (18.5 <= lat <= 22.5 and -161.0 <= lon <= -154.0):
-                return {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32602,
-                        "message": "Location outside Hawaiian Islands bounds"
-                    }
-                }
-            
-            # Call the main analysis function
+
+            if not (_MCP_LAT_MIN <= lat <= _MCP_LAT_MAX
+                    and _MCP_LON_MIN <= lon <= _MCP_LON_MAX):
+                return _MCP_OUT_OF_BOUNDS
+
+            # Delegate to the main analysis endpoint so MCP callers get the
+            # same pipeline, store writes and background-task scheduling
             analysis_request = AnalysisRequest(
                 latitude=lat,
                 longitude=lon,
                 demo_mode=arguments.get("demo_mode", False)
             )
-            
-            result = await create_analysis(analysis_request)
-            
+
+            result = await start_analysis(analysis_request, background_tasks)
+
             return {
                 "jsonrpc": "2.0",
                 "result": {
@@ -1021,55 +1739,22 @@ async def mcp_call_tool(request: dict):
                     }]
                 }
             }
-            
-        elif tool_name == "get_satellite_analysis":
-            # This would call satellite analysis directly
-            return {
-                "jsonrpc": "2.0", 
-                "result": {
-                    "content": [{
-                        "type": "text",
-                        "text": "Satellite analysis capability available via full wildfire analysis"
-                    }]
-                }
-            }
-            
-        elif tool_name == "get_weather_conditions":
-            # This would call weather analysis directly
-            return {
-                "jsonrpc": "2.0",
-                "result": {
-                    "content": [{
-                        "type": "text", 
-                        "text": "Weather analysis capability available via full wildfire analysis"
-                    }]
-                }
-            }
-            
-        elif tool_name == "get_power_infrastructure":
-            # This would call power infrastructure analysis directly
-            return {
-                "jsonrpc": "2.0",
-                "result": {
-                    "content": [{
-                        "type": "text",
-                        "text": "Power infrastructure analysis capability available via full wildfire analysis" 
-                    }]
-                }
-            }
-            
-        else:
-            return {
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32601,
-                    "message": f"Unknown tool: {tool_name}"
-                }
+
+        capability = _MCP_CAPABILITY_RESPONSES.get(tool_name)
+        if capability is not None:
+            return capability
+
+        return {
+            "jsonrpc": "2.0",
+            "error": {
+                "code": -32601,
+                "message": f"Unknown tool: {tool_name}"
             }
-            
+        }
+
     except Exception as e:
         return {
-            "jsonrpc": "2.0", 
+            "jsonrpc": "2.0",
             "error": {
                 "code": -32603,
                 "message": f"Tool execution error: {str(e)}"
@@ -1083,19 +1768,30 @@ async def mcp_health_check():
     MCP health check endpoint
     Returns comprehensive system status for MCP integration
     """
-    # Test all integrations
-    satellite_status = await test_satellite_analysis_systems()
-    noaa_status = await test_noaa_connection()
-    make_status = await test_make_webhook()
-    s3_status = test_s3_connection()
-    overpass_status = test_overpass_connection()
-    
+    # Probe all integrations concurrently - they are independent network
+    # calls, so wall time is the slowest probe instead of the sum of five.
+    # The sync S3/Overpass checks run in threads to keep the loop free
+    satellite_status, noaa_status, make_status, s3_status, overpass_status = (
+        await asyncio.gather(
+            test_satellite_analysis_systems(),
+            test_noaa_connection(),
+            test_make_webhook(),
+            asyncio.to_thread(test_s3_connection),
+            asyncio.to_thread(test_overpass_connection),
+            return_exceptions=True
+        )
+    )
+    if isinstance(satellite_status, BaseException):
+        satellite_status = {}
+    if isinstance(make_status, BaseException):
+        make_status = {}
+
     services = {
         "clarifai": satellite_status.get("clarifai", {}).get("status", "unknown"),
-        "anthropic": satellite_status.get("anthropic", {}).get("status", "unknown"), 
-        "aws_s3": "healthy" if s3_status else "degraded",
-        "noaa_weather": "healthy" if noaa_status else "degraded",
-        "overpass_api": "healthy" if overpass_status else "degraded",
+        "anthropic": satellite_status.get("anthropic", {}).get("status", "unknown"),
+        "aws_s3": "healthy" if s3_status is True else "degraded",
+        "noaa_weather": "healthy" if noaa_status is True else "degraded",
+        "overpass_api": "healthy" if overpass_status is True else "degraded",
         "make_webhook": make_status.get("status", "unknown")
     }
     
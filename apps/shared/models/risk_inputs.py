@@ -29,6 +29,7 @@ class SatelliteData(BaseModel):
     dryness_score: float = Field(..., ge=-1, le=1, description="Vegetation dryness score from Clarifai NDVI")
     tile_date: str = Field(..., description="Date of satellite imagery")
     confidence: float = Field(default=1.0, ge=0, le=1, description="Analysis confidence")
+    analysis_method: Optional[str] = Field(default=None, description="Which analyzer produced the score")
 
 
 class RiskAssessment(BaseModel):
@@ -47,6 +48,8 @@ class AnalysisResult(BaseModel):
     satellite: Optional[SatelliteData] = None
     risk_assessment: Optional[RiskAssessment] = None
     jira_ticket_url: Optional[str] = None
+    phases_done: int = Field(default=0, description="Bitmap of completed pipeline phases")
+    completed_at: Optional[str] = Field(default=None, description="ISO timestamp of completion")
     processing_time_seconds: float = Field(default=0.0)
     status: str = Field(default="processing")
     error_message: Optional[str] = None
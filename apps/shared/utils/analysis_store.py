@@ -0,0 +1,173 @@
+"""
+Analysis result store for PyroGuard Sentinel
+
+Results were previously held in a plain module-level dict, so every Uvicorn
+worker only saw its own jobs and memory grew without bound. This store
+writes each result through to Redis as a TTL-keyed JSON blob (when
+REDIS_URL is configured) so any replica can serve /progress and /result
+for any analysis and old entries expire on their own. Without Redis it
+degrades to the old in-process behavior, which is all a single-worker
+deployment needs.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from apps.shared.models.risk_inputs import AnalysisResult
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+RESULT_TTL_SECONDS = int(os.getenv("ANALYSIS_RESULT_TTL", "3600"))
+
+# Cap on the in-process cache: without it a long-lived worker accumulates one
+# AnalysisResult per analysis it ever ran, which is a slow leak under load
+LOCAL_CACHE_MAX = int(os.getenv("ANALYSIS_LOCAL_CACHE_MAX", "10000"))
+
+
+class AnalysisStore:
+    """Redis-backed result store with a local write-through cache
+
+    Results are stored as one JSON blob per analysis (SET with EX) rather
+    than a per-phase hash: the pipeline always writes through a full
+    AnalysisResult, so a single key keeps reads one round-trip and lets the
+    model validate the whole document on the way back in.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = REDIS_URL,
+        ttl: int = RESULT_TTL_SECONDS,
+        local_max: int = LOCAL_CACHE_MAX
+    ):
+        self._url = url
+        self._ttl = ttl
+        self._local_max = local_max
+        self._redis = None
+        # Local cache: in-process readers (pipeline, SSE loop) skip the
+        # round-trip; sole storage when Redis is not configured. Bounded LRU
+        # with the same TTL as the Redis blobs - entries are (expires_at,
+        # result) in insertion/recency order so eviction is O(1)
+        self._local: "OrderedDict[str, Tuple[float, AnalysisResult]]" = OrderedDict()
+
+    def _get_redis(self):
+        """Lazily connect so import cost and failures stay off the hot path"""
+        if self._redis is None and self._url:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(self._url, decode_responses=True)
+                logger.info("✅ Analysis store using Redis backend")
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable, using in-memory store: {e}")
+                self._url = None
+        return self._redis
+
+    @property
+    def has_redis(self) -> bool:
+        """True while a Redis backend is configured and not written off"""
+        return self._url is not None
+
+    @staticmethod
+    def _key(analysis_id: str) -> str:
+        return f"analysis:{analysis_id}"
+
+    @staticmethod
+    def _channel(analysis_id: str) -> str:
+        return f"analysis:{analysis_id}:events"
+
+    async def publish_event(self, analysis_id: str, message: str) -> None:
+        """Broadcast a progress event to subscribers in other workers"""
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.publish(self._channel(analysis_id), message)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis publish failed for {analysis_id}: {e}")
+
+    async def subscribe_events(self, analysis_id: str):
+        """Subscribe to this analysis's event channel; None without Redis"""
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self._channel(analysis_id))
+            return pubsub
+        except Exception as e:
+            logger.warning(f"⚠️ Redis subscribe failed for {analysis_id}: {e}")
+            return None
+
+    async def get(self, analysis_id: str) -> Optional[AnalysisResult]:
+        """Fetch a result, preferring the local cache over Redis"""
+        entry = self._local.get(analysis_id)
+        if entry is not None:
+            expires_at, result = entry
+            if time.monotonic() < expires_at:
+                self._local.move_to_end(analysis_id)
+                return result
+            del self._local[analysis_id]
+
+        client = self._get_redis()
+        if client is None:
+            return None
+
+        try:
+            raw = await client.get(self._key(analysis_id))
+            if raw:
+                return AnalysisResult.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis read failed for {analysis_id}: {e}")
+        return None
+
+    async def set(
+        self,
+        analysis_id: str,
+        result: AnalysisResult,
+        event: Optional[str] = None
+    ) -> None:
+        """Store a result locally and write it through to Redis with a TTL
+
+        When an event message is supplied, the SET and the PUBLISH go out on
+        one pipeline (transaction=False - ordering matters, atomicity does
+        not), so persisting a phase and broadcasting it costs a single
+        round-trip instead of two.
+        """
+        self._local[analysis_id] = (time.monotonic() + self._ttl, result)
+        self._local.move_to_end(analysis_id)
+        while len(self._local) > self._local_max:
+            self._local.popitem(last=False)
+
+        client = self._get_redis()
+        if client is None:
+            return
+
+        try:
+            if event is None:
+                await client.set(
+                    self._key(analysis_id),
+                    result.model_dump_json(),
+                    ex=self._ttl
+                )
+            else:
+                pipe = client.pipeline(transaction=False)
+                pipe.set(
+                    self._key(analysis_id),
+                    result.model_dump_json(),
+                    ex=self._ttl
+                )
+                pipe.publish(self._channel(analysis_id), event)
+                await pipe.execute()
+        except Exception as e:
+            # Phase payloads may briefly hold non-model objects; local cache
+            # still serves this worker, so log and move on
+            logger.warning(f"⚠️ Redis write failed for {analysis_id}: {e}")
+
+    def evict(self, analysis_id: str) -> None:
+        """Drop the local cache entry (Redis expiry handles the blob)"""
+        self._local.pop(analysis_id, None)
@@ -0,0 +1,53 @@
+"""
+Minimal async circuit breaker for external service probes
+
+When an upstream service is down, every caller otherwise pays the full
+connect/read timeout before learning what the last caller already knew. The
+breaker opens after a run of consecutive failures and fast-fails callers for
+a cooldown window, then lets a single trial call through (half-open) to test
+whether the service recovered.
+"""
+
+import time
+from typing import Awaitable, Callable
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class AsyncCircuitBreaker:
+    """Consecutive-failure circuit breaker for awaitable calls"""
+
+    def __init__(self, fail_max: int = 3, reset_timeout: float = 60.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """True while the cooldown window is still running"""
+        if self._failures < self.fail_max:
+            return False
+        # After the cooldown the breaker is half-open: the next call runs as
+        # a trial and either closes the circuit or re-opens it
+        return time.monotonic() - self._opened_at < self.reset_timeout
+
+    async def call(self, factory: Callable[[], Awaitable]):
+        """Run factory() through the breaker, fast-failing while open"""
+        if self.is_open:
+            raise CircuitOpenError(
+                f"circuit open after {self._failures} consecutive failures"
+            )
+
+        try:
+            result = await factory()
+        except Exception:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+            raise
+
+        self._failures = 0
+        return result
@@ -0,0 +1,38 @@
+"""
+Shared pooled HTTP client for PyroGuard Sentinel outbound integrations
+
+The NOAA, Make.com and Anthropic helpers used to open a fresh
+httpx.AsyncClient per call, paying a new TCP + TLS handshake every time -
+that handshake dominates per-probe latency. One process-wide client with
+keep-alive amortizes it to zero for repeat calls; per-call timeouts are
+passed at the request site where they differ from the default.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=_LIMITS)
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """Close the pooled client; called from application shutdown"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
@@ -6,6 +6,8 @@ Sends comprehensive wildfire analysis data to Make.com scenario for Jira automat
 import os
 import logging
 import httpx
+
+from apps.shared.utils.http_client import get_http_client
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
@@ -41,40 +43,41 @@ async def send_wildfire_analysis_to_make(analysis_data: Dict[str, Any]) -> Optio
         
         logger.info(f"📤 Sending wildfire analysis to Make.com webhook...")
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                MAKE_WEBHOOK_URL,
-                json=webhook_payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "PyroGuard Sentinel v1.0"
-                }
-            )
+        client = get_http_client()
+        response = await client.post(
+            MAKE_WEBHOOK_URL,
+            json=webhook_payload,
+            headers={
+                "Content-Type": "application/json",
+                "User-Agent": "PyroGuard Sentinel v1.0"
+            },
+            timeout=30.0
+        )
             
-            if response.status_code == 200:
-                logger.info("✅ Make.com webhook triggered successfully")
+        if response.status_code == 200:
+            logger.info("✅ Make.com webhook triggered successfully")
                 
-                # Try to extract Jira ticket URL from response
-                try:
-                    response_data = response.json()
-                    ticket_url = extract_jira_ticket_url(response_data, analysis_data)
+            # Try to extract Jira ticket URL from response
+            try:
+                response_data = response.json()
+                ticket_url = extract_jira_ticket_url(response_data, analysis_data)
                     
-                    if ticket_url:
-                        logger.info(f"🎫 Jira ticket created: {ticket_url}")
-                        return ticket_url
-                    else:
-                        # Generate estimated ticket URL based on pattern
-                        return generate_estimated_ticket_url(analysis_data)
-                        
-                except Exception as e:
-                    logger.warning(f"Could not parse Make.com response: {e}")
+                if ticket_url:
+                    logger.info(f"🎫 Jira ticket created: {ticket_url}")
+                    return ticket_url
+                else:
+                    # Generate estimated ticket URL based on pattern
                     return generate_estimated_ticket_url(analysis_data)
-            elif response.status_code == 400 and "queue is full" in response.text.lower():
-                logger.info("✅ Make.com webhook received (queue temporarily full) - generating fallback ticket")
+                        
+            except Exception as e:
+                logger.warning(f"Could not parse Make.com response: {e}")
                 return generate_estimated_ticket_url(analysis_data)
-            else:
-                logger.error(f"❌ Make.com webhook failed: {response.status_code} - {response.text}")
-                return None
+        elif response.status_code == 400 and "queue is full" in response.text.lower():
+            logger.info("✅ Make.com webhook received (queue temporarily full) - generating fallback ticket")
+            return generate_estimated_ticket_url(analysis_data)
+        else:
+            logger.error(f"❌ Make.com webhook failed: {response.status_code} - {response.text}")
+            return None
                 
     except Exception as e:
         logger.error(f"❌ Make.com webhook error: {str(e)}")
@@ -91,19 +94,17 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     3. Include all analysis details
     4. Add location and environmental context
     """
-    request_data = analysis_data.get("request", {})
-    coordinates = getattr(request_data, "latitude", None), getattr(request_data, "longitude", None)
-    
-    if hasattr(request_data, "latitude"):
-        lat, lon = request_data.latitude, request_data.longitude
-    else:
-        lat, lon = 20.7967, -156.3319  # Default Hawaii coordinates
+    # The pipeline hands over the raw phase dicts - plain key lookups, no
+    # attribute introspection on wrapper objects
+    request_data = analysis_data.get("request") or {}
+    lat = request_data.get("latitude", 20.7967)
+    lon = request_data.get("longitude", -156.3319)  # Default Hawaii coordinates
     
     # Extract risk assessment
-    risk_assessment = analysis_data.get("risk_assessment")
-    severity = risk_assessment.severity if risk_assessment else "UNKNOWN"
-    risk_level = risk_assessment.risk_level if risk_assessment else 0.5
-    rationale = risk_assessment.rationale if risk_assessment else "Analysis pending"
+    risk_assessment = analysis_data.get("risk_assessment") or {}
+    severity = risk_assessment.get("severity", "UNKNOWN")
+    risk_level = risk_assessment.get("risk_level", 0.5)
+    rationale = risk_assessment.get("rationale", "Analysis pending")
     
     # Extract environmental data
     weather = analysis_data.get("weather")
@@ -140,7 +141,7 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         f"🚨 *Risk Assessment:*",
         f"• Severity Level: *{severity}*",
         f"• Risk Score: {risk_level:.2f} ({risk_level*100:.0f}%)",
-        f"• Confidence: {risk_assessment.confidence*100:.0f}% " if risk_assessment and hasattr(risk_assessment, 'confidence') else "",
+        f"• Confidence: {risk_assessment['confidence']*100:.0f}% " if risk_assessment.get("confidence") is not None else "",
         f"• Analysis Method: {analysis_data.get('analysis_method', 'unknown')}",
         f"",
         f"📊 *Environmental Conditions:*"
@@ -149,11 +150,11 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     # Add weather information
     if weather:
         description_parts.extend([
-            f"• Temperature: {weather.temperature_f}°F",
-            f"• Humidity: {weather.humidity_percent}%",
-            f"• Wind Speed: {weather.wind_speed_mph} mph {getattr(weather, 'wind_direction', '')}",
-            f"• Conditions: {weather.conditions}",
-            f"• Station: {getattr(weather, 'station_id', 'N/A')}"
+            f"• Temperature: {weather.get('temperature_f')}°F",
+            f"• Humidity: {weather.get('humidity_percent')}%",
+            f"• Wind Speed: {weather.get('wind_speed_mph')} mph {weather.get('wind_direction', '')}",
+            f"• Conditions: {weather.get('conditions')}",
+            f"• Station: {weather.get('station_id', 'N/A')}"
         ])
     
     # Add satellite data
@@ -161,10 +162,10 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         description_parts.extend([
             f"",
             f"🛰️ *Satellite Analysis:*",
-            f"• Vegetation Dryness: {satellite.dryness_score*100:.1f}%",
-            f"• Confidence: {satellite.confidence*100:.0f}%",
-            f"• Image Date: {satellite.tile_date}",
-            f"• Analysis Method: {getattr(satellite, 'model_used', 'N/A')}"
+            f"• Vegetation Dryness: {satellite.get('dryness_score', 0)*100:.1f}%",
+            f"• Confidence: {satellite.get('confidence', 0)*100:.0f}%",
+            f"• Image Date: {satellite.get('tile_date')}",
+            f"• Analysis Method: {satellite.get('model_used', 'N/A')}"
         ])
     
     # Add power infrastructure data
@@ -172,9 +173,9 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         description_parts.extend([
             f"",
             f"⚡ *Power Infrastructure:*",
-            f"• Power Lines (500m radius): {power_lines.count}",
-            f"• Nearest Distance: {power_lines.nearest_distance_m:.0f}m",
-            f"• Transmission Risk: {'HIGH' if power_lines.nearest_distance_m < 100 else 'MEDIUM' if power_lines.nearest_distance_m < 300 else 'LOW'}"
+            f"• Power Lines (500m radius): {power_lines.get('count')}",
+            f"• Nearest Distance: {power_lines.get('nearest_distance_m', 0):.0f}m",
+            f"• Transmission Risk: {'HIGH' if power_lines.get('nearest_distance_m', 1000) < 100 else 'MEDIUM' if power_lines.get('nearest_distance_m', 1000) < 300 else 'LOW'}"
         ])
     
     # Add analysis rationale
@@ -221,7 +222,7 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
                 "level": risk_level,
                 "severity": severity,
                 "rationale": rationale,
-                "confidence": risk_assessment.confidence if risk_assessment and hasattr(risk_assessment, 'confidence') else None
+                "confidence": risk_assessment.get("confidence")
             },
             "processing_time_seconds": analysis_data.get("processing_time_seconds", 0)
         },
@@ -229,23 +230,23 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         # Environmental context
         "environment": {
             "weather": {
-                "temperature_f": weather.temperature_f if weather else None,
-                "humidity_percent": weather.humidity_percent if weather else None,
-                "wind_speed_mph": weather.wind_speed_mph if weather else None,
-                "conditions": weather.conditions if weather else None,
-                "station_id": getattr(weather, 'station_id', None) if weather else None
+                "temperature_f": weather.get("temperature_f"),
+                "humidity_percent": weather.get("humidity_percent"),
+                "wind_speed_mph": weather.get("wind_speed_mph"),
+                "conditions": weather.get("conditions"),
+                "station_id": weather.get("station_id")
             } if weather else None,
             
             "satellite": {
-                "dryness_score": satellite.dryness_score if satellite else None,
-                "confidence": satellite.confidence if satellite else None,
-                "tile_date": satellite.tile_date if satellite else None,
-                "model_used": getattr(satellite, 'model_used', None) if satellite else None
+                "dryness_score": satellite.get("dryness_score"),
+                "confidence": satellite.get("confidence"),
+                "tile_date": satellite.get("tile_date"),
+                "model_used": satellite.get("model_used")
             } if satellite else None,
             
             "power_infrastructure": {
-                "count": power_lines.count if power_lines else None,
-                "nearest_distance_m": power_lines.nearest_distance_m if power_lines else None
+                "count": power_lines.get("count"),
+                "nearest_distance_m": power_lines.get("nearest_distance_m")
             } if power_lines else None
         },
         
@@ -253,7 +254,7 @@ def prepare_webhook_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         "webhook_metadata": {
             "source": "pyroguard_sentinel",
             "version": "1.0.0",
-            "demo_mode": getattr(request_data, "demo_mode", False),
+            "demo_mode": request_data.get("demo_mode", False),
             "sent_at": datetime.now().isoformat()
         }
     }
@@ -296,12 +297,15 @@ def generate_estimated_ticket_url(analysis_data: Dict[str, Any]) -> str:
     Generate estimated Jira ticket URL when Make.com response doesn't include it
     """
     jira_base = os.getenv("JIRA_BASE_URL", "https://nalamaui30.atlassian.net")
-    
-    # Generate ticket number based on analysis ID hash
+
+    # Derive the ticket number from the UUID's trailing hex digits - stable
+    # across processes and restarts, unlike hash() with randomized seeds
     analysis_id = analysis_data.get("analysis_id", "unknown")
-    import hashlib
-    ticket_num = abs(hash(analysis_id)) % 1000
-    
+    try:
+        ticket_num = int(analysis_id[-3:], 16) % 1000
+    except ValueError:
+        ticket_num = 0
+
     return f"{jira_base}/browse/PYRO-{ticket_num:03d}"
 
 
@@ -330,27 +334,28 @@ async def test_make_webhook() -> Dict[str, Any]:
             }
         }
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                MAKE_WEBHOOK_URL,
-                json=test_payload,
-                headers={"Content-Type": "application/json"}
-            )
+        client = get_http_client()
+        response = await client.post(
+            MAKE_WEBHOOK_URL,
+            json=test_payload,
+            headers={"Content-Type": "application/json"},
+            timeout=15.0
+        )
             
-            # Determine status - queue full means webhook is working
-            if response.status_code == 200:
-                status = "healthy"
-            elif response.status_code == 400 and "queue is full" in response.text.lower():
-                status = "healthy"  # Queue full means webhook is working, just busy
-            else:
-                status = "error"
+        # Determine status - queue full means webhook is working
+        if response.status_code == 200:
+            status = "healthy"
+        elif response.status_code == 400 and "queue is full" in response.text.lower():
+            status = "healthy"  # Queue full means webhook is working, just busy
+        else:
+            status = "error"
             
-            return {
-                "status": status,
-                "status_code": response.status_code,
-                "response": response.text[:200] if response.text else None,
-                "timestamp": datetime.now().isoformat()
-            }
+        return {
+            "status": status,
+            "status_code": response.status_code,
+            "response": response.text[:200] if response.text else None,
+            "timestamp": datetime.now().isoformat()
+        }
             
     except Exception as e:
         return {
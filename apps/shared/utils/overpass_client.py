@@ -49,10 +49,46 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def nearest_distance_m(center_lat: float, center_lon: float, points) -> float:
+    """Find the nearest haversine distance from center to a sequence of (lat, lon)
+
+    Structured for bulk scans: the center-side trig is hoisted out of the
+    loop, math functions are bound to locals, and comparisons happen on the
+    haversine 'a' term (monotonic with distance), so the expensive
+    sqrt/atan2 finish runs once instead of per point.
+    """
+    radians = math.radians
+    sin = math.sin
+    cos = math.cos
+    cos_lat1 = cos(radians(center_lat))
+
+    best_a = float('inf')
+    for lat, lon in points:
+        sin_dlat = sin(radians(lat - center_lat) * 0.5)
+        sin_dlon = sin(radians(lon - center_lon) * 0.5)
+        a = sin_dlat * sin_dlat + cos_lat1 * cos(radians(lat)) * sin_dlon * sin_dlon
+        if a < best_a:
+            best_a = a
+
+    if best_a == float('inf'):
+        return best_a
+    return 2 * 6371000 * math.atan2(math.sqrt(best_a), math.sqrt(1 - best_a))
+
+
 def build_overpass_query(lat: float, lon: float, radius_m: int = SEARCH_RADIUS_M) -> str:
-    """Build Overpass API query for power infrastructure"""
+    """Build Overpass API query for power infrastructure
+
+    A global bbox setting is derived from the search radius and added
+    alongside the around: filters: Overpass prunes candidates against the
+    rectangle with its spatial index before running the more expensive
+    per-element circle test, which noticeably cuts server-side query time.
+    """
+    delta_lat = radius_m / 111_000
+    delta_lon = radius_m / (111_000 * math.cos(math.radians(lat)))
+    south, north = lat - delta_lat, lat + delta_lat
+    west, east = lon - delta_lon, lon + delta_lon
     return f"""
-    [out:json][timeout:{TIMEOUT_SECONDS}];
+    [out:json][timeout:{TIMEOUT_SECONDS}][bbox:{south},{west},{north},{east}];
     (
       way["power"="line"](around:{radius_m},{lat},{lon});
       way["power"="minor_line"](around:{radius_m},{lat},{lon});
@@ -158,25 +194,26 @@ def analyze_power_infrastructure(overpass_data: Dict[str, Any], center_lat: floa
         elif power_type == "pole":
             power_poles.append(element)
     
-    # Calculate distances to nearest infrastructure
-    min_distance = float('inf')
-    
-    # Check distances to power lines
+    # Flatten every feature coordinate into one (lat, lon) sequence, then do
+    # a single bulk nearest-distance scan instead of a haversine call (with
+    # all its per-call trig) per node
+    points = []
     for line in power_lines:
         if "geometry" in line:
             for node in line["geometry"]:
-                distance = calculate_distance(center_lat, center_lon, node["lat"], node["lon"])
-                min_distance = min(min_distance, distance)
+                points.append((node["lat"], node["lon"]))
         elif "lat" in line and "lon" in line:
-            distance = calculate_distance(center_lat, center_lon, line["lat"], line["lon"])
-            min_distance = min(min_distance, distance)
-    
-    # Check distances to towers and poles
-    for feature in transmission_towers + power_poles:
+            points.append((line["lat"], line["lon"]))
+
+    for feature in transmission_towers:
         if "lat" in feature and "lon" in feature:
-            distance = calculate_distance(center_lat, center_lon, feature["lat"], feature["lon"])
-            min_distance = min(min_distance, distance)
-    
+            points.append((feature["lat"], feature["lon"]))
+    for feature in power_poles:
+        if "lat" in feature and "lon" in feature:
+            points.append((feature["lat"], feature["lon"]))
+
+    min_distance = nearest_distance_m(center_lat, center_lon, points)
+
     # If no infrastructure found, set distance to search radius
     if min_distance == float('inf'):
         min_distance = SEARCH_RADIUS_M
@@ -10,6 +10,8 @@ import asyncio
 from typing import Dict, Any, Optional, Union, Tuple
 from datetime import datetime
 import httpx
+
+from apps.shared.utils.http_client import get_http_client
 from .clarifai_ndvi import get_dryness_score, test_clarifai_connection
 
 logger = logging.getLogger(__name__)
@@ -280,69 +282,69 @@ Where:
 - confidence: 0.0 to 1.0 indicating analysis certainty
 - reasoning: brief explanation of assessment"""
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "Content-Type": "application/json",
-                    "anthropic-version": "2023-06-01"
-                },
-                json={
-                    "model": "claude-3-5-sonnet-20241022",
-                    "max_tokens": 200,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "image",
-                                    "source": {
-                                        "type": "base64",
-                                        "media_type": "image/jpeg",
-                                        "data": image_base64
-                                    }
-                                },
-                                {
-                                    "type": "text",
-                                    "text": prompt
+        client = get_http_client()
+        response = await client.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": ANTHROPIC_API_KEY,
+                "Content-Type": "application/json",
+                "anthropic-version": "2023-06-01"
+            },
+            json={
+                "model": "claude-3-5-sonnet-20241022",
+                "max_tokens": 200,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "image",
+                                "source": {
+                                    "type": "base64",
+                                    "media_type": "image/jpeg",
+                                    "data": image_base64
                                 }
-                            ]
-                        }
-                    ]
-                },
-                timeout=15.0
-            )
+                            },
+                            {
+                                "type": "text",
+                                "text": prompt
+                            }
+                        ]
+                    }
+                ]
+            },
+            timeout=15.0
+        )
             
-            if response.status_code != 200:
-                logger.error(f"❌ Anthropic API error: HTTP {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                return -1.0, 0.0, "Anthropic Vision API (API error)"
+        if response.status_code != 200:
+            logger.error(f"❌ Anthropic API error: HTTP {response.status_code}")
+            logger.error(f"Response: {response.text}")
+            return -1.0, 0.0, "Anthropic Vision API (API error)"
             
-            response_data = response.json()
-            content_text = response_data["content"][0]["text"]
+        response_data = response.json()
+        content_text = response_data["content"][0]["text"]
             
-            # Parse JSON response
-            import json
-            try:
-                analysis = json.loads(content_text)
-                dryness = float(analysis.get("dryness", 0.5))
-                confidence = float(analysis.get("confidence", 0.5))
-                reasoning = analysis.get("reasoning", "Analysis completed")
+        # Parse JSON response
+        import json
+        try:
+            analysis = json.loads(content_text)
+            dryness = float(analysis.get("dryness", 0.5))
+            confidence = float(analysis.get("confidence", 0.5))
+            reasoning = analysis.get("reasoning", "Analysis completed")
                 
-                # Ensure values are within valid range
-                dryness = max(0.0, min(1.0, dryness))
-                confidence = max(0.1, min(1.0, confidence))
+            # Ensure values are within valid range
+            dryness = max(0.0, min(1.0, dryness))
+            confidence = max(0.1, min(1.0, confidence))
                 
-                logger.info(f"✅ Anthropic analysis: dryness={dryness:.3f}, confidence={confidence:.3f}")
-                logger.info(f"💭 Reasoning: {reasoning}")
+            logger.info(f"✅ Anthropic analysis: dryness={dryness:.3f}, confidence={confidence:.3f}")
+            logger.info(f"💭 Reasoning: {reasoning}")
                 
-                return dryness, confidence, "Anthropic Vision API (Claude 3 Sonnet)"
+            return dryness, confidence, "Anthropic Vision API (Claude 3 Sonnet)"
                 
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.error(f"❌ Failed to parse Anthropic response: {e}")
-                logger.error(f"Raw response: {content_text}")
-                return -1.0, 0.0, "Anthropic Vision API (parse error)"
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.error(f"❌ Failed to parse Anthropic response: {e}")
+            logger.error(f"Raw response: {content_text}")
+            return -1.0, 0.0, "Anthropic Vision API (parse error)"
                 
     except httpx.TimeoutException:
         logger.error("⏰ Anthropic API timeout")
@@ -427,31 +429,31 @@ async def test_satellite_analysis_systems() -> Dict[str, Any]:
             results["anthropic"]["error"] = "ANTHROPIC_API_KEY environment variable not set"
         else:
             # Simple test of Anthropic API
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": ANTHROPIC_API_KEY,
-                        "Content-Type": "application/json",
-                        "anthropic-version": "2023-06-01"
-                    },
-                    json={
-                        "model": "claude-3-5-sonnet-20241022",
-                        "max_tokens": 10,
-                        "messages": [{"role": "user", "content": "test"}]
-                    },
-                    timeout=5.0
-                )
+            client = get_http_client()
+            response = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                headers={
+                    "x-api-key": ANTHROPIC_API_KEY,
+                    "Content-Type": "application/json",
+                    "anthropic-version": "2023-06-01"
+                },
+                json={
+                    "model": "claude-3-5-sonnet-20241022",
+                    "max_tokens": 10,
+                    "messages": [{"role": "user", "content": "test"}]
+                },
+                timeout=5.0
+            )
                 
-                if response.status_code == 200:
-                    results["anthropic"]["status"] = "healthy"
-                    results["anthropic"]["message"] = "Claude 3 Vision API accessible"
-                elif response.status_code == 401:
-                    results["anthropic"]["status"] = "auth_failed"
-                    results["anthropic"]["error"] = "Invalid ANTHROPIC_API_KEY"
-                else:
-                    results["anthropic"]["status"] = "connection_failed"
-                    results["anthropic"]["error"] = f"HTTP {response.status_code}"
+            if response.status_code == 200:
+                results["anthropic"]["status"] = "healthy"
+                results["anthropic"]["message"] = "Claude 3 Vision API accessible"
+            elif response.status_code == 401:
+                results["anthropic"]["status"] = "auth_failed"
+                results["anthropic"]["error"] = "Invalid ANTHROPIC_API_KEY"
+            else:
+                results["anthropic"]["status"] = "connection_failed"
+                results["anthropic"]["error"] = f"HTTP {response.status_code}"
     except httpx.TimeoutException:
         results["anthropic"]["status"] = "timeout"
         results["anthropic"]["error"] = "API timeout"
@@ -5,13 +5,10 @@ import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Tuple
-import boto3
-import rasterio
-from rasterio.session import AWSSession
-from rasterio import windows
-from rasterio.warp import transform_bounds, calculate_default_transform
-import requests
-from botocore.exceptions import NoCredentialsError, ClientError
+
+# boto3 and rasterio are imported lazily inside the functions that need them -
+# they are by far the heaviest imports in the API process and deferring them
+# keeps cold start (and dev reload) fast
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +124,11 @@ def fetch_sentinel2_live(lat: float, lon: float) -> Optional[bytes]:
     Fetch live Sentinel-2 imagery from AWS S3 and extract 512x512 window.
     """
     try:
+        import boto3
+        import rasterio
+        from rasterio import windows
+        from rasterio.session import AWSSession
+
         # Set up AWS session with requester pays
         aws_session = AWSSession(
             boto3.Session(
@@ -162,7 +164,12 @@ def fetch_sentinel2_live(lat: float, lon: float) -> Optional[bytes]:
                             window_size
                         )
                         
-                        # Read the window
+                        # Read the window - rasterio only fetches the COG
+                        # byte ranges covering these 512x512 pixels, so the
+                        # ~100 km source tile is never buffered in full. The
+                        # resulting PNG is a few hundred KB and downstream
+                        # analyzers base64 it into a single request body, so
+                        # it stays fully materialized rather than streamed
                         img_data = src.read(window=window)
                         
                         # Save as PNG using rasterio
@@ -256,22 +263,37 @@ def get_sentinel_tile_name(lat: float, lon: float) -> str:
     return "04QFJ"  # Default tile for Hawaii
 
 
+# boto3 clients are expensive to construct (credential resolution, endpoint
+# discovery) but thread-safe for reuse - build once, share across probes
+_s3_client = None
+
+
+def _get_s3_client():
+    """Return a cached S3 client, creating it on first use"""
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+
+        session = boto3.Session(
+            aws_access_key_id=AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+            region_name=AWS_REGION
+        )
+        _s3_client = session.client('s3')
+    return _s3_client
+
+
 def test_s3_connection() -> bool:
     """Test AWS S3 connection for satellite imagery access"""
+    from botocore.exceptions import ClientError, NoCredentialsError
+
     try:
         if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
             logger.warning("AWS credentials not configured")
             return False
-        
-        # Test basic S3 connectivity
-        session = boto3.Session(
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-            region_name=AWS_REGION
-        )
-        
-        s3_client = session.client('s3')
-        
+
+        s3_client = _get_s3_client()
+
         # Test with a simple head request to Sentinel-2 bucket
         try:
             s3_client.head_bucket(Bucket='sentinel-s2-l2a')
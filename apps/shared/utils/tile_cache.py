@@ -0,0 +1,96 @@
+"""
+Per-tile TTL cache for external sub-results
+
+Repeat analyses of the same or neighboring coordinates re-ran the Clarifai,
+NOAA and Overpass calls from scratch even though the underlying data barely
+changes between requests. Coordinates are quantized to a ~1 km grid and each
+sub-result is cached under its tile with a freshness-matched TTL, so hot
+locations skip the external round-trips entirely. Backed by Redis when
+REDIS_URL is configured (shared across workers), with an in-process dict
+fallback mirroring AnalysisStore.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+# 0.01 degrees is roughly 1 km - close enough that neighboring clicks on the
+# map share satellite, weather and power-line conditions
+TILE_STEP_DEGREES = 0.01
+
+
+def tile_key(lat: float, lon: float, step: float = TILE_STEP_DEGREES) -> str:
+    """Quantize coordinates to a tile identifier"""
+    return f"{round(lat / step) * step:.2f}:{round(lon / step) * step:.2f}"
+
+
+class TileCache:
+    """TTL cache keyed by (prefix, tile), Redis-backed with local fallback"""
+
+    def __init__(self, url: Optional[str] = REDIS_URL):
+        self._url = url
+        self._redis = None
+        self._local: Dict[str, Tuple[float, Any]] = {}
+        # Hit/miss counters so cache effectiveness shows up in the logs
+        self.hits = 0
+        self.misses = 0
+
+    def _get_redis(self):
+        if self._redis is None and self._url:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(self._url, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"⚠️ Redis unavailable for tile cache: {e}")
+                self._url = None
+        return self._redis
+
+    @staticmethod
+    def _key(prefix: str, lat: float, lon: float) -> str:
+        return f"tile:{prefix}:{tile_key(lat, lon)}"
+
+    async def get(self, prefix: str, lat: float, lon: float) -> Optional[Any]:
+        """Return the cached sub-result for this tile, or None on miss"""
+        key = self._key(prefix, lat, lon)
+
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self.hits += 1
+                return value
+            del self._local[key]
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                raw = await client.get(key)
+                if raw:
+                    self.hits += 1
+                    return json.loads(raw)
+            except Exception as e:
+                logger.warning(f"⚠️ Tile cache read failed for {key}: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, prefix: str, lat: float, lon: float, value: Any, ttl: int) -> None:
+        """Cache a sub-result for this tile with the given TTL in seconds"""
+        key = self._key(prefix, lat, lon)
+        self._local[key] = (time.monotonic() + ttl, value)
+
+        client = self._get_redis()
+        if client is None:
+            return
+
+        try:
+            await client.set(key, json.dumps(value), ex=ttl)
+        except Exception as e:
+            logger.warning(f"⚠️ Tile cache write failed for {key}: {e}")
@@ -10,6 +10,8 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 import httpx
 
+from apps.shared.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Configuration from environment
@@ -112,39 +114,39 @@ async def get_grid_info(latitude: float, longitude: float) -> Optional[Dict[str,
     try:
         logger.info(f"📍 Fetching NOAA grid info: {url}")
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(url, headers=headers)
+        client = get_http_client()
+        response = await client.get(url, headers=headers, timeout=15.0)
             
-            if response.status_code == 404:
-                logger.warning("Location outside NOAA coverage area")
-                return None
-            elif response.status_code != 200:
-                logger.warning(f"NOAA points API error: {response.status_code}")
-                return None
+        if response.status_code == 404:
+            logger.warning("Location outside NOAA coverage area")
+            return None
+        elif response.status_code != 200:
+            logger.warning(f"NOAA points API error: {response.status_code}")
+            return None
             
-            data = response.json()
-            properties = data.get("properties", {})
+        data = response.json()
+        properties = data.get("properties", {})
             
-            grid_info = {
-                "grid_office": properties.get("cwa"),
-                "grid_x": properties.get("gridX"),
-                "grid_y": properties.get("gridY"),
-                "forecast_url": properties.get("forecast"),
-                "forecast_hourly_url": properties.get("forecastHourly"),
-                "forecast_grid_data_url": properties.get("forecastGridData"),
-                "observation_stations_url": properties.get("observationStations"),
-                "timezone": properties.get("timeZone"),
-                "coordinates": {"latitude": latitude, "longitude": longitude}
-            }
+        grid_info = {
+            "grid_office": properties.get("cwa"),
+            "grid_x": properties.get("gridX"),
+            "grid_y": properties.get("gridY"),
+            "forecast_url": properties.get("forecast"),
+            "forecast_hourly_url": properties.get("forecastHourly"),
+            "forecast_grid_data_url": properties.get("forecastGridData"),
+            "observation_stations_url": properties.get("observationStations"),
+            "timezone": properties.get("timeZone"),
+            "coordinates": {"latitude": latitude, "longitude": longitude}
+        }
             
-            # Get nearest observation station
-            if grid_info["observation_stations_url"]:
-                station_info = await get_nearest_observation_station(grid_info["observation_stations_url"])
-                if station_info:
-                    grid_info["observation_station"] = station_info["station_id"]
-                    grid_info["observation_station_name"] = station_info["name"]
+        # Get nearest observation station
+        if grid_info["observation_stations_url"]:
+            station_info = await get_nearest_observation_station(grid_info["observation_stations_url"])
+            if station_info:
+                grid_info["observation_station"] = station_info["station_id"]
+                grid_info["observation_station_name"] = station_info["name"]
             
-            return grid_info
+        return grid_info
             
     except Exception as e:
         logger.error(f"Error fetching NOAA grid info: {str(e)}")
@@ -159,24 +161,24 @@ async def get_nearest_observation_station(stations_url: str) -> Optional[Dict[st
     }
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(stations_url, headers=headers)
+        client = get_http_client()
+        response = await client.get(stations_url, headers=headers)
             
-            if response.status_code == 200:
-                data = response.json()
-                features = data.get("features", [])
+        if response.status_code == 200:
+            data = response.json()
+            features = data.get("features", [])
                 
-                if features:
-                    # Take the first station (they're ordered by distance)
-                    station = features[0]
-                    properties = station.get("properties", {})
+            if features:
+                # Take the first station (they're ordered by distance)
+                station = features[0]
+                properties = station.get("properties", {})
                     
-                    return {
-                        "station_id": properties.get("stationIdentifier"),
-                        "name": properties.get("name"),
-                        "elevation": properties.get("elevation", {}).get("value"),
-                        "coordinates": station.get("geometry", {}).get("coordinates", [])
-                    }
+                return {
+                    "station_id": properties.get("stationIdentifier"),
+                    "name": properties.get("name"),
+                    "elevation": properties.get("elevation", {}).get("value"),
+                    "coordinates": station.get("geometry", {}).get("coordinates", [])
+                }
                     
     except Exception as e:
         logger.error(f"Error fetching observation stations: {str(e)}")
@@ -202,58 +204,58 @@ async def get_current_conditions(grid_info: Dict[str, Any]) -> Dict[str, Any]:
     try:
         await asyncio.sleep(RATE_LIMIT_DELAY)  # Rate limiting
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
+        client = get_http_client()
+        response = await client.get(url, headers=headers)
             
-            if response.status_code != 200:
-                logger.warning(f"Current conditions API error: {response.status_code}")
-                return {}
+        if response.status_code != 200:
+            logger.warning(f"Current conditions API error: {response.status_code}")
+            return {}
             
-            data = response.json()
-            properties = data.get("properties", {})
+        data = response.json()
+        properties = data.get("properties", {})
             
-            # Convert all measurements to standard units
-            conditions = {}
+        # Convert all measurements to standard units
+        conditions = {}
             
-            # Temperature (convert from Celsius if needed)
-            temp_c = get_measurement_value(properties.get("temperature"))
-            if temp_c is not None:
-                conditions["temperature_f"] = celsius_to_fahrenheit(temp_c)
+        # Temperature (convert from Celsius if needed)
+        temp_c = get_measurement_value(properties.get("temperature"))
+        if temp_c is not None:
+            conditions["temperature_f"] = celsius_to_fahrenheit(temp_c)
             
-            # Humidity  
-            humidity = get_measurement_value(properties.get("relativeHumidity"))
-            if humidity is not None:
-                conditions["humidity_percent"] = float(humidity)
+        # Humidity  
+        humidity = get_measurement_value(properties.get("relativeHumidity"))
+        if humidity is not None:
+            conditions["humidity_percent"] = float(humidity)
             
-            # Wind speed (convert from m/s if needed)
-            wind_speed_ms = get_measurement_value(properties.get("windSpeed"))
-            if wind_speed_ms is not None:
-                conditions["wind_speed_mph"] = meters_per_second_to_mph(wind_speed_ms)
+        # Wind speed (convert from m/s if needed)
+        wind_speed_ms = get_measurement_value(properties.get("windSpeed"))
+        if wind_speed_ms is not None:
+            conditions["wind_speed_mph"] = meters_per_second_to_mph(wind_speed_ms)
             
-            # Wind direction
-            wind_dir = get_measurement_value(properties.get("windDirection"))
-            if wind_dir is not None:
-                conditions["wind_direction"] = degrees_to_cardinal(wind_dir)
+        # Wind direction
+        wind_dir = get_measurement_value(properties.get("windDirection"))
+        if wind_dir is not None:
+            conditions["wind_direction"] = degrees_to_cardinal(wind_dir)
             
-            # Conditions text
-            conditions["conditions"] = properties.get("textDescription", "unknown").lower()
+        # Conditions text
+        conditions["conditions"] = properties.get("textDescription", "unknown").lower()
             
-            # Pressure (convert from Pa to mb)
-            pressure_pa = get_measurement_value(properties.get("barometricPressure"))
-            if pressure_pa is not None:
-                conditions["pressure_mb"] = pascals_to_millibars(pressure_pa)
+        # Pressure (convert from Pa to mb)
+        pressure_pa = get_measurement_value(properties.get("barometricPressure"))
+        if pressure_pa is not None:
+            conditions["pressure_mb"] = pascals_to_millibars(pressure_pa)
             
-            # Visibility (convert from meters)
-            visibility_m = get_measurement_value(properties.get("visibility"))
-            if visibility_m is not None:
-                conditions["visibility_miles"] = meters_to_miles(visibility_m)
+        # Visibility (convert from meters)
+        visibility_m = get_measurement_value(properties.get("visibility"))
+        if visibility_m is not None:
+            conditions["visibility_miles"] = meters_to_miles(visibility_m)
             
-            # Dewpoint
-            dewpoint_c = get_measurement_value(properties.get("dewpoint"))
-            if dewpoint_c is not None:
-                conditions["dewpoint_f"] = celsius_to_fahrenheit(dewpoint_c)
+        # Dewpoint
+        dewpoint_c = get_measurement_value(properties.get("dewpoint"))
+        if dewpoint_c is not None:
+            conditions["dewpoint_f"] = celsius_to_fahrenheit(dewpoint_c)
             
-            return conditions
+        return conditions
             
     except Exception as e:
         logger.error(f"Error fetching current conditions: {str(e)}")
@@ -276,42 +278,42 @@ async def get_forecast_data(grid_info: Dict[str, Any]) -> Optional[Dict[str, Any
     try:
         await asyncio.sleep(RATE_LIMIT_DELAY)  # Rate limiting
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(forecast_url, headers=headers)
+        client = get_http_client()
+        response = await client.get(forecast_url, headers=headers)
             
-            if response.status_code != 200:
-                return None
+        if response.status_code != 200:
+            return None
             
-            data = response.json()
-            periods = data.get("properties", {}).get("periods", [])
+        data = response.json()
+        periods = data.get("properties", {}).get("periods", [])
             
-            if not periods:
-                return None
+        if not periods:
+            return None
             
-            # Get today's forecast period
-            today_period = periods[0]
+        # Get today's forecast period
+        today_period = periods[0]
             
-            forecast_data = {
-                "conditions": today_period.get("shortForecast", "").lower(),
-                "detailed_forecast": today_period.get("detailedForecast", ""),
-                "wind_speed": today_period.get("windSpeed", ""),
-                "wind_direction": today_period.get("windDirection", "")
-            }
+        forecast_data = {
+            "conditions": today_period.get("shortForecast", "").lower(),
+            "detailed_forecast": today_period.get("detailedForecast", ""),
+            "wind_speed": today_period.get("windSpeed", ""),
+            "wind_direction": today_period.get("windDirection", "")
+        }
             
-            # Extract temperature
-            if today_period.get("temperature"):
-                if today_period.get("temperatureUnit") == "F":
-                    if "High" in today_period.get("name", ""):
-                        forecast_data["high_temperature_f"] = today_period["temperature"]
-                    else:
-                        forecast_data["low_temperature_f"] = today_period["temperature"]
+        # Extract temperature
+        if today_period.get("temperature"):
+            if today_period.get("temperatureUnit") == "F":
+                if "High" in today_period.get("name", ""):
+                    forecast_data["high_temperature_f"] = today_period["temperature"]
+                else:
+                    forecast_data["low_temperature_f"] = today_period["temperature"]
             
-            # Check for fire weather warnings in detailed forecast
-            detailed = today_period.get("detailedForecast", "").lower()
-            fire_keywords = ["fire weather", "red flag", "extreme fire danger", "critical fire weather"]
-            forecast_data["fire_weather_warning"] = any(keyword in detailed for keyword in fire_keywords)
+        # Check for fire weather warnings in detailed forecast
+        detailed = today_period.get("detailedForecast", "").lower()
+        fire_keywords = ["fire weather", "red flag", "extreme fire danger", "critical fire weather"]
+        forecast_data["fire_weather_warning"] = any(keyword in detailed for keyword in fire_keywords)
             
-            return forecast_data
+        return forecast_data
             
     except Exception as e:
         logger.error(f"Error fetching forecast data: {str(e)}")
@@ -399,10 +401,22 @@ async def test_noaa_connection() -> bool:
         # Test with Honolulu coordinates
         test_url = f"{NOAA_BASE_URL}/points/21.3099,-157.8581"
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(test_url, headers=headers)
-            return response.status_code == 200
+        client = get_http_client()
+        response = await client.get(test_url, headers=headers)
+        return response.status_code == 200
             
     except Exception as e:
         logger.error(f"NOAA connection test failed: {str(e)}")
-        return False 
\ No newline at end of file
+        return False
+
+
+async def test_noaa_status() -> Dict[str, Any]:
+    """
+    Status-dict variant of test_noaa_connection for the health endpoints,
+    matching the shape the other integration probes already return
+    """
+    try:
+        ok = await test_noaa_connection()
+        return {"status": "healthy" if ok else "error"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
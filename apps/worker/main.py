@@ -3,13 +3,14 @@ import json
 import logging
 import time
 from datetime import datetime
+from functools import cache
 from typing import Dict, Any, Optional
 
 import httpx
-import boto3
 from inngest import Inngest
 
 # Import our utilities
+from apps.shared.utils.http_client import get_http_client
 from apps.shared.utils.satellite_client import get_satellite_png, is_in_hawaii
 from apps.shared.utils.clarifai_ndvi import get_dryness_score
 from apps.shared.utils.weather_client import get_weather_data, create_demo_weather_data
@@ -22,19 +23,42 @@ inngest = Inngest(app_id="pyroguard-worker")
 
 # Configuration
 API_BASE_URL = os.getenv("NEXT_PUBLIC_API_URL", "http://localhost:8080")
+
+# When the shared token is configured, the API's update endpoint trusts
+# these payloads and skips re-validating the sub-result models
+_INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+_UPDATE_HEADERS = {"x-internal-token": _INTERNAL_API_TOKEN} if _INTERNAL_API_TOKEN else None
 BEDROCK_MODEL_ID = "anthropic.claude-3-sonnet-20240229-v1:0"
 
 
+@cache
+def _get_bedrock_client():
+    """Lazily import boto3 and build the Bedrock client once
+
+    Keeps the boto3 import (and its credential/endpoint resolution) off the
+    worker's boot path; after the first call this is a cache hit.
+    """
+    import boto3
+
+    return boto3.client(
+        'bedrock-runtime',
+        region_name=os.getenv('AWS_REGION', 'us-west-2'),
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+    )
+
+
 async def update_analysis_progress(analysis_id: str, update_data: Dict[str, Any]) -> bool:
     """Update analysis progress via API"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_BASE_URL}/api/v1/analyze/{analysis_id}/update",
-                json=update_data,
-                timeout=10.0
-            )
-            return response.status_code == 200
+        client = get_http_client()
+        response = await client.post(
+            f"{API_BASE_URL}/api/v1/analyze/{analysis_id}/update",
+            json=update_data,
+            headers=_UPDATE_HEADERS,
+            timeout=10.0
+        )
+        return response.status_code == 200
     except Exception as e:
         logger.error(f"Failed to update analysis progress: {str(e)}")
         return False
@@ -50,13 +74,8 @@ def get_bedrock_risk_assessment(
 ) -> Dict[str, Any]:
     """Get final risk assessment from AWS Bedrock Claude Sonnet"""
     try:
-        # Initialize Bedrock client
-        bedrock = boto3.client(
-            'bedrock-runtime',
-            region_name=os.getenv('AWS_REGION', 'us-west-2'),
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
-        )
+        # Cached client: constructed lazily on first assessment
+        bedrock = _get_bedrock_client()
         
         # Construct prompt for Claude Sonnet
         prompt = f"""You are a wildfire risk assessment expert. Analyze the following data and provide a JSON response.
@@ -204,22 +223,22 @@ async def trigger_jira_ticket(analysis_data: Dict[str, Any]) -> Optional[str]:
             "analysis_data": analysis_data
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                webhook_url,
-                json=payload,
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                # Make.com typically returns the created issue details
-                result = response.json()
-                ticket_url = result.get("issue_url") or result.get("ticket_url") or f"https://nalamaui30.atlassian.net/browse/PYRO-{int(time.time() % 10000)}"
-                logger.info(f"✅ Jira ticket created: {ticket_url}")
-                return ticket_url
-            else:
-                logger.error(f"Make.com webhook failed: {response.status_code} - {response.text}")
-                return None
+        client = get_http_client()
+        response = await client.post(
+            webhook_url,
+            json=payload,
+            timeout=30.0
+        )
+
+        if response.status_code == 200:
+            # Make.com typically returns the created issue details
+            result = response.json()
+            ticket_url = result.get("issue_url") or result.get("ticket_url") or f"https://nalamaui30.atlassian.net/browse/PYRO-{int(time.time() % 10000)}"
+            logger.info(f"✅ Jira ticket created: {ticket_url}")
+            return ticket_url
+        else:
+            logger.error(f"Make.com webhook failed: {response.status_code} - {response.text}")
+            return None
     
     except Exception as e:
         logger.error(f"Jira ticket creation failed: {str(e)}")